@@ -0,0 +1,20 @@
+import multiprocessing
+import os
+
+# Production server: gunicorn src.main:app (this file is picked up automatically)
+bind = f"0.0.0.0:{os.environ.get('PORT', 5000)}"
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count()))
+
+# Green-thread workers multiplex slow I/O (URL fetches, LLM calls) per process
+worker_class = 'gevent'
+worker_connections = 1000
+timeout = 120  # Company analyses fan out to several LLM calls
+
+def post_fork(server, worker):
+    # Make psycopg2 yield to other greenlets while waiting on Postgres
+    from psycogreen.gevent import patch_psycopg
+    patch_psycopg()
+
+    # The provider limits are per account, so each worker only gets its share of them
+    from src.services.rate_limiter import share_limits
+    share_limits(server.cfg.workers)
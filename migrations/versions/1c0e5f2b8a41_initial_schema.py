@@ -0,0 +1,45 @@
+"""Initial schema: ai_interactions and company_analyses
+
+Revision ID: 1c0e5f2b8a41
+Revises:
+Create Date: 2026-10-15 22:50:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '1c0e5f2b8a41'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Tables as they were first created by db.create_all(); if_not_exists adopts databases that predate migrations
+    op.create_table(
+        'ai_interactions',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('timestamp', sa.DateTime(), nullable=False),
+        sa.Column('user_input', sa.Text(), nullable=False),
+        sa.Column('ai_response', sa.Text(), nullable=False),
+        sa.Column('ai_model', sa.String(length=100), nullable=False),
+        sa.Column('context', sa.Text(), nullable=True),
+        sa.Column('rating', sa.Integer(), nullable=True),
+        if_not_exists=True
+    )
+    op.create_table(
+        'company_analyses',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('company_name', sa.String(length=200), nullable=False),
+        sa.Column('analysis_date', sa.DateTime(), nullable=True),
+        sa.Column('insights', sa.Text(), nullable=True),
+        sa.Column('platform_scores', sa.Text(), nullable=True),
+        if_not_exists=True
+    )
+
+
+def downgrade():
+    op.drop_table('company_analyses')
+    op.drop_table('ai_interactions')
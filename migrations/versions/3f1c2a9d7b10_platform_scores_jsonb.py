@@ -0,0 +1,44 @@
+"""Store company_analyses.platform_scores as JSONB on Postgres
+
+Revision ID: 3f1c2a9d7b10
+Revises: 1c0e5f2b8a41
+Create Date: 2026-10-15 23:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '3f1c2a9d7b10'
+down_revision = '1c0e5f2b8a41'
+branch_labels = None
+depends_on = None
+
+
+def _platform_scores_is_jsonb():
+    """Whether the column is already JSONB (tables adopted from a db.create_all() of the current models)"""
+    columns = sa.inspect(op.get_bind()).get_columns('company_analyses')
+    return any(column['name'] == 'platform_scores' and isinstance(column['type'], postgresql.JSONB) for column in columns)
+
+
+def upgrade():
+    # SQLite stores JSON as text either way, so only Postgres needs the conversion
+    if op.get_bind().dialect.name != 'postgresql' or _platform_scores_is_jsonb():
+        return
+    op.alter_column(
+        'company_analyses', 'platform_scores',
+        type_=postgresql.JSONB(),
+        postgresql_using='platform_scores::jsonb'
+    )
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql' or not _platform_scores_is_jsonb():
+        return
+    op.alter_column(
+        'company_analyses', 'platform_scores',
+        type_=sa.Text(),
+        postgresql_using='platform_scores::text'
+    )
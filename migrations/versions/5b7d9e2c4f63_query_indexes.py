@@ -0,0 +1,50 @@
+"""Index interaction timestamps, analysis date/company name and rating aggregates
+
+Revision ID: 5b7d9e2c4f63
+Revises: 3f1c2a9d7b10
+Create Date: 2026-10-15 23:20:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5b7d9e2c4f63'
+down_revision = '3f1c2a9d7b10'
+branch_labels = None
+depends_on = None
+
+# (name, table, columns); if_not_exists skips indexes db.create_all() already built on adopted tables
+INDEXES = [
+    ('ix_ai_interactions_timestamp_desc', 'ai_interactions', [sa.text('"timestamp" DESC')]),
+    ('ix_company_analyses_date_desc', 'company_analyses', [sa.text('analysis_date DESC'), sa.text('id DESC')]),
+    ('ix_company_analyses_company_name', 'company_analyses', ['company_name']),
+]
+
+
+def upgrade():
+    if op.get_bind().dialect.name == 'postgresql':
+        # CONCURRENTLY keeps the tables writable while the indexes build; it cannot run inside a transaction
+        with op.get_context().autocommit_block():
+            for name, table, columns in INDEXES:
+                op.create_index(name, table, columns, if_not_exists=True, postgresql_concurrently=True)
+            # Covering index so dashboard COUNT/AVG(rating) is an index-only scan; INCLUDE is Postgres-only
+            op.create_index(
+                'ix_ai_rating_cover', 'ai_interactions', ['id'], if_not_exists=True,
+                postgresql_include=['rating', 'timestamp'], postgresql_concurrently=True
+            )
+    else:
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, if_not_exists=True)
+
+
+def downgrade():
+    if op.get_bind().dialect.name == 'postgresql':
+        with op.get_context().autocommit_block():
+            op.drop_index('ix_ai_rating_cover', table_name='ai_interactions', if_exists=True, postgresql_concurrently=True)
+            for name, table, _ in reversed(INDEXES):
+                op.drop_index(name, table_name=table, if_exists=True, postgresql_concurrently=True)
+    else:
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, if_exists=True)
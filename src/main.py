@@ -1,13 +1,18 @@
 from flask_cors import CORS
-from flask import Flask, render_template, request, jsonify, redirect, url_for, flash
+from flask import Flask, render_template, request, jsonify, redirect, url_for, flash, stream_with_context, abort
+from sqlalchemy import lambda_stmt, select, update
 from src.routes.analysis import analysis_bp
 from src.models import db  # Import db from models
-from flask_migrate import Migrate
+from src.cache import cache
+from src.json_provider import ORJSONProvider
+from flask_migrate import Migrate, upgrade
 from datetime import datetime
 import os
 import logging
+import orjson
 
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 CORS(app)
 
 # Database Configuration
@@ -22,14 +27,39 @@ if database_url:
         database_url = database_url.replace("postgresql://", "postgresql+psycopg2://", 1)
     
     app.config["SQLALCHEMY_DATABASE_URI"] = database_url
+    
+    # Connection pool. Every gunicorn worker opens its own pool, so a worker may hold up to
+    # DB_POOL_SIZE + DB_MAX_OVERFLOW connections and the server WEB_CONCURRENCY times that.
+    # By default a total of DB_MAX_CONNECTIONS (kept under Postgres' default max_connections=100)
+    # is split across the workers; requests beyond it queue for a connection instead of failing.
+    if database_url.startswith("postgresql"):
+        web_workers = max(1, int(os.environ.get("WEB_CONCURRENCY", os.cpu_count() or 1)))
+        worker_connections = max(2, int(os.environ.get("DB_MAX_CONNECTIONS", 80)) // web_workers)
+        pool_size = int(os.environ.get("DB_POOL_SIZE", worker_connections // 2))
+        app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {
+            "pool_size": pool_size,
+            "max_overflow": int(os.environ.get("DB_MAX_OVERFLOW", max(0, worker_connections - pool_size))),
+            "pool_pre_ping": True,
+            "pool_recycle": 1800,
+        }
 else:
     app.config["SQLALCHEMY_DATABASE_URI"] = 'sqlite:///ai_visibility.db'
 
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'your-secret-key-change-this')
 
+# Cache Configuration (Redis when available, in-process otherwise)
+redis_url = os.environ.get("REDIS_URL")
+
+if redis_url:
+    app.config["CACHE_TYPE"] = "RedisCache"
+    app.config["CACHE_REDIS_URL"] = redis_url
+else:
+    app.config["CACHE_TYPE"] = "SimpleCache"
+
 # Initialize extensions
 db.init_app(app)  # Changed from db = SQLAlchemy(app)
+cache.init_app(app)
 migrate = Migrate(app, db)
 
 # Register blueprints
@@ -51,10 +81,16 @@ class AIInteraction(db.Model):
     context = db.Column(db.Text)  # Additional context about the interaction
     rating = db.Column(db.Integer)  # User rating of the response (1-5)
     
+    __table_args__ = (
+        db.Index('ix_ai_interactions_timestamp_desc', timestamp.desc()),
+        # Covering index so dashboard COUNT/AVG(rating) is an index-only scan on Postgres
+        db.Index('ix_ai_rating_cover', id, postgresql_include=['rating', 'timestamp']).ddl_if(dialect='postgresql'),
+    )
+    
     def to_dict(self):
         return {
             'id': self.id,
-            'timestamp': self.timestamp.isoformat(),
+            'timestamp': self.timestamp,
             'user_input': self.user_input,
             'ai_response': self.ai_response,
             'ai_model': self.ai_model,
@@ -62,19 +98,34 @@ class AIInteraction(db.Model):
             'rating': self.rating
         }
 
+# Hot-path statements, built once and cached by lambda identity
+RECENT_INTERACTIONS_STMT = lambda_stmt(
+    lambda: select(AIInteraction).order_by(AIInteraction.timestamp.desc()).limit(10)
+)
+INTERACTION_STATS_STMT = lambda_stmt(
+    lambda: select(db.func.count(AIInteraction.id), db.func.avg(AIInteraction.rating))
+)
+LATEST_INTERACTIONS_STMT = lambda_stmt(
+    lambda: select(AIInteraction).order_by(AIInteraction.timestamp.desc()).limit(100)
+)
+
+DASHBOARD_CACHE_KEY = 'view/dashboard'
+
+def _is_successful(response):
+    """Only cache plain (200) responses, never error tuples"""
+    return not isinstance(response, tuple)
+
 # Routes
 @app.route('/')
+@cache.cached(timeout=30, key_prefix=DASHBOARD_CACHE_KEY, response_filter=_is_successful)
 def index():
     """Main dashboard page - returns API status and basic stats"""
     try:
         # Get recent interactions
-        recent_interactions = AIInteraction.query.order_by(
-            AIInteraction.timestamp.desc()
-        ).limit(10).all()
+        recent_interactions = db.session.execute(RECENT_INTERACTIONS_STMT).scalars().all()
 
-        # Get statistics
-        total_interactions = AIInteraction.query.count()
-        avg_rating = db.session.query(db.func.avg(AIInteraction.rating)).scalar()
+        # Get statistics in a single round-trip
+        total_interactions, avg_rating = db.session.execute(INTERACTION_STATS_STMT).one()
 
         stats = {
             'total_interactions': total_interactions,
@@ -108,6 +159,7 @@ def log_interaction():
         
         db.session.add(interaction)
         db.session.commit()
+        cache.delete(DASHBOARD_CACHE_KEY)
         
         return jsonify({
             'success': True, 
@@ -123,6 +175,68 @@ def log_interaction():
             'message': f'Error logging interaction: {str(e)}'
         }), 500
 
+def _interaction_error(item):
+    """Why a posted interaction can't be stored, or None if it is valid"""
+    if not isinstance(item, dict):
+        return 'expected an object'
+    for field in ('user_input', 'ai_response'):
+        if not isinstance(item.get(field), str):
+            return f"'{field}' is required and must be a string"
+    if 'ai_model' in item and not isinstance(item['ai_model'], str):
+        return "'ai_model' must be a string"
+    if item.get('context') is not None and not isinstance(item['context'], str):
+        return "'context' must be a string"
+    rating = item.get('rating')
+    if rating is not None and (type(rating) is not int or not 1 <= rating <= 5):
+        return "'rating' must be an integer from 1 to 5"
+    return None
+
+@app.route('/log_interactions', methods=['POST'])
+def log_interactions():
+    """Log a batch of AI interactions in a single transaction"""
+    try:
+        data = request.get_json()
+        
+        if not isinstance(data, list):
+            return jsonify({
+                'success': False,
+                'message': 'Expected a JSON list of interactions'
+            }), 400
+        
+        for index, item in enumerate(data):
+            error = _interaction_error(item)
+            if error:
+                return jsonify({
+                    'success': False,
+                    'message': f'Invalid interaction at index {index}: {error}'
+                }), 400
+        
+        rows = [{
+            'user_input': item.get('user_input', ''),
+            'ai_response': item.get('ai_response', ''),
+            'ai_model': item.get('ai_model', 'Unknown'),
+            'context': item.get('context', ''),
+            'rating': item.get('rating')
+        } for item in data]
+        
+        db.session.bulk_insert_mappings(AIInteraction, rows)
+        db.session.commit()
+        cache.delete(DASHBOARD_CACHE_KEY)
+        
+        return jsonify({
+            'success': True,
+            'message': 'Interactions logged successfully',
+            'count': len(rows)
+        })
+        
+    except Exception as e:
+        logger.error(f"Error logging interactions: {e}")
+        db.session.rollback()
+        return jsonify({
+            'success': False,
+            'message': f'Error logging interactions: {str(e)}'
+        }), 500
+
 @app.route('/interactions')
 def view_interactions():
     """View all interactions with pagination"""
@@ -159,12 +273,21 @@ def view_interaction(interaction_id):
 def rate_interaction(interaction_id):
     """Rate an AI interaction"""
     try:
-        interaction = AIInteraction.query.get_or_404(interaction_id)
         rating = request.form.get('rating', type=int)
         
         if rating and 1 <= rating <= 5:
-            interaction.rating = rating
+            # Single UPDATE ... RETURNING instead of SELECT then UPDATE
+            result = db.session.execute(
+                update(AIInteraction)
+                .where(AIInteraction.id == interaction_id)
+                .values(rating=rating)
+                .returning(AIInteraction.id)
+            )
+            if result.scalar() is None:
+                db.session.rollback()
+                abort(404)
             db.session.commit()
+            cache.delete(DASHBOARD_CACHE_KEY)
             flash('Rating saved successfully', 'success')
         else:
             flash('Invalid rating. Please select a rating between 1 and 5.', 'error')
@@ -178,17 +301,25 @@ def rate_interaction(interaction_id):
 
 @app.route('/api/interactions')
 def api_interactions():
-    """API endpoint to get interactions as JSON"""
+    """API endpoint to get interactions as JSON (streamed row by row)"""
     try:
-        interactions = AIInteraction.query.order_by(
-            AIInteraction.timestamp.desc()
-        ).limit(100).all()
-        
-        return jsonify([interaction.to_dict() for interaction in interactions])
+        interactions = db.session.execute(
+            LATEST_INTERACTIONS_STMT, execution_options={'yield_per': 50}
+        ).scalars()
         
     except Exception as e:
         logger.error(f"Error in API interactions: {e}")
         return jsonify({'error': 'Failed to fetch interactions'}), 500
+    
+    def generate():
+        yield b'['
+        for i, interaction in enumerate(interactions):
+            if i:
+                yield b','
+            yield orjson.dumps(interaction.to_dict())
+        yield b']'
+    
+    return app.response_class(stream_with_context(generate()), mimetype='application/json')
 
 @app.route('/health')
 def health_check():
@@ -211,10 +342,10 @@ def health_check():
         }), 500
 
 if __name__ == '__main__':
-    # Create database tables if they don't exist
+    # Create or upgrade the database schema (same migrations as 'flask --app src.main db upgrade')
     with app.app_context():
-        db.create_all()
-        logger.info("Database tables created successfully")
+        upgrade()
+        logger.info("Database schema is up to date")
     
     # Get port from environment variable (Render uses PORT)
     port = int(os.environ.get('PORT', 5000))
@@ -1,3 +1,7 @@
 from flask_sqlalchemy import SQLAlchemy
 
+# Relationship conventions: declare both sides with back_populates and load
+# collections with lazy='selectin' (one extra query per page, never one per row).
+# lazy='dynamic' is not allowed. List endpoints use raiseload('*') so any
+# relationship they touch without an explicit selectinload() fails loudly.
 db = SQLAlchemy()
@@ -1,6 +1,6 @@
 from src.models import db  # Import the shared db instance
+from sqlalchemy.dialects.postgresql import JSONB
 from datetime import datetime
-import json
 
 class CompanyAnalysis(db.Model):
     """Model for storing company AI visibility analyses"""
@@ -10,20 +10,32 @@ class CompanyAnalysis(db.Model):
     company_name = db.Column(db.String(200), nullable=False)
     analysis_date = db.Column(db.DateTime, default=datetime.utcnow)
     insights = db.Column(db.Text)
-    platform_scores = db.Column(db.Text)  # JSON stored as text
+    platform_scores = db.Column(db.JSON().with_variant(JSONB, 'postgresql'))  # Native JSON, JSONB on Postgres
+    
+    __table_args__ = (
+        db.Index('ix_company_analyses_date_desc', analysis_date.desc(), id.desc()),
+        db.Index('ix_company_analyses_company_name', company_name),
+    )
     
     def set_platform_scores(self, platform, scores):
         """Set scores for a specific platform"""
-        current_scores = json.loads(self.platform_scores) if self.platform_scores else {}
-        current_scores[platform] = scores
-        self.platform_scores = json.dumps(current_scores)
+        # Assign a new dict so SQLAlchemy detects the change
+        self.platform_scores = {**(self.platform_scores or {}), platform: scores}
     
     def to_dict(self):
         """Convert to dictionary for JSON response"""
         return {
             'id': self.id,
             'company_name': self.company_name,
-            'analysis_date': self.analysis_date.isoformat(),
+            'analysis_date': self.analysis_date,
             'insights': self.insights,
-            'platform_scores': json.loads(self.platform_scores) if self.platform_scores else {}
+            'platform_scores': self.platform_scores or {}
+        }
+    
+    def to_summary_dict(self):
+        """Lightweight dictionary for list views (omits scores and insights)"""
+        return {
+            'id': self.id,
+            'company_name': self.company_name,
+            'analysis_date': self.analysis_date
         }
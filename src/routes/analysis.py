@@ -1,13 +1,91 @@
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, Response, jsonify, request
+from sqlalchemy import tuple_
+from sqlalchemy.orm import load_only, raiseload
 from src.models.analysis import CompanyAnalysis, db
 from src.services.ai_analyzer import AIAnalyzer
+from src.services.event_loop import run_async
 import json
-import requests  
-from bs4 import BeautifulSoup
+import orjson
 from src.services.url_analyzer import URLAnalyzer
+from src.cache import cache
+from datetime import datetime, timedelta
 
 analysis_bp = Blueprint('analysis', __name__)
 
+ANALYSIS_FRESHNESS = timedelta(hours=24)
+MAX_BATCH_URLS = 20
+MAX_PER_PAGE = 100  # Same cap paginate() applies
+
+PLATFORMS = [
+    {'name': 'ChatGPT', 'id': 'chatgpt', 'provider': 'OpenAI'},
+    {'name': 'Claude', 'id': 'claude', 'provider': 'Anthropic'},
+    {'name': 'Perplexity AI', 'id': 'perplexity', 'provider': 'Perplexity'},
+    {'name': 'Arc Search', 'id': 'arc_search', 'provider': 'The Browser Company'},
+    {'name': 'SearchGPT', 'id': 'searchgpt', 'provider': 'OpenAI'}
+]
+
+METHODOLOGIES = [
+    {
+        'id': 'cidr',
+        'name': 'CIDR',
+        'full_name': 'Contextual Intent-Driven Ranking',
+        'description': 'How well do LLMs understand the intent behind queries related to this company?'
+    },
+    {
+        'id': 'scvs',
+        'name': 'SCVS',
+        'full_name': 'Source Credibility & Verifiability Score',
+        'description': 'How well is the company represented in verifiable, reputable, and cited sources?'
+    },
+    {
+        'id': 'acso',
+        'name': 'ACSO',
+        'full_name': 'Adaptive Content Structure Optimization',
+        'description': 'Is the company\'s online content structured in a way that\'s easy for AI to parse and summarize?'
+    },
+    {
+        'id': 'uifl',
+        'name': 'UIFL',
+        'full_name': 'User Interaction & Feedback Loop',
+        'description': 'How often is this company positively engaged with through AI tools (clicks, follow-ups, thumbs up)?'
+    }
+]
+
+# The listings never change, so serialize them once at import
+_PLATFORMS_BODY = orjson.dumps(PLATFORMS)
+_METHODOLOGIES_BODY = orjson.dumps(METHODOLOGIES)
+
+def _static_json_response(body):
+    return Response(body, mimetype='application/json', headers={'Cache-Control': 'public, max-age=86400'})
+
+def _analysis_cache_key(company_name):
+    return f'analysis/{company_name}'
+
+def _cache_analysis(analysis):
+    """Cache an analysis' dict until it is older than ANALYSIS_FRESHNESS"""
+    remaining = analysis.analysis_date + ANALYSIS_FRESHNESS - datetime.utcnow()
+    data = analysis.to_dict()
+    cache.set(_analysis_cache_key(analysis.company_name), data, timeout=max(1, int(remaining.total_seconds())))
+    return data
+
+def _next_cursor(analysis):
+    """Keyset cursor pointing just past the given analysis"""
+    return {'after_ts': analysis.analysis_date, 'after_id': analysis.id}
+
+def _get_recent_analysis(company_name):
+    """Return the latest analysis (as a dict) from the last 24 hours, or None"""
+    cached = cache.get(_analysis_cache_key(company_name))
+    if cached is not None:
+        return cached
+    
+    cutoff = datetime.utcnow() - ANALYSIS_FRESHNESS
+    analysis = CompanyAnalysis.query.filter(
+        CompanyAnalysis.company_name == company_name,
+        CompanyAnalysis.analysis_date >= cutoff
+    ).order_by(CompanyAnalysis.analysis_date.desc()).first()
+    
+    return _cache_analysis(analysis) if analysis else None
+
 @analysis_bp.route('/analyze', methods=['POST'])
 def analyze_company():
     """Analyze a company's AI visibility across platforms"""
@@ -19,17 +97,19 @@ def analyze_company():
             return jsonify({'error': 'Company name is required'}), 400
         
         # Check if analysis already exists for this company (within last 24 hours)
-        existing_analysis = CompanyAnalysis.query.filter_by(company_name=company_name).first()
+        existing_analysis = _get_recent_analysis(company_name)
         
         if existing_analysis:
             return jsonify({
                 'message': 'Analysis found in cache',
-                'data': existing_analysis.to_dict()
+                'data': existing_analysis
             }), 200
         
+        # Release the pooled connection while the (slow, network-bound) analysis runs
+        db.session.close()
+        
         # Perform new analysis
-        analyzer = AIAnalyzer()
-        analysis_results = analyzer.analyze_company(company_name)
+        analysis_results = run_async(AIAnalyzer().analyze_company(company_name))
         
         # Save to database
         analysis = CompanyAnalysis(
@@ -46,7 +126,7 @@ def analyze_company():
         
         return jsonify({
             'message': 'Analysis completed successfully',
-            'data': analysis.to_dict()
+            'data': _cache_analysis(analysis)
         }), 201
         
     except Exception as e:
@@ -70,71 +150,60 @@ def get_company_analysis(company_name):
 
 @analysis_bp.route('/analysis', methods=['GET'])
 def get_all_analyses():
-    """Get all analyses with pagination"""
+    """Get all analyses, paginated by page number or by keyset cursor (after_ts/after_id)"""
     page = request.args.get('page', 1, type=int)
-    per_page = request.args.get('per_page', 10, type=int)
+    per_page = max(1, min(request.args.get('per_page', 10, type=int), MAX_PER_PAGE))
+    after_ts = request.args.get('after_ts', type=datetime.fromisoformat)
+    after_id = request.args.get('after_id', type=int)
+    
+    # Only fetch the columns the list view needs; anything else raises instead of lazy-loading
+    query = CompanyAnalysis.query.options(
+        load_only(CompanyAnalysis.id, CompanyAnalysis.company_name, CompanyAnalysis.analysis_date, raiseload=True),
+        raiseload('*')
+    ).order_by(CompanyAnalysis.analysis_date.desc(), CompanyAnalysis.id.desc())
     
-    analyses = CompanyAnalysis.query.order_by(CompanyAnalysis.analysis_date.desc()).paginate(
+    if after_ts and after_id is not None:
+        # Keyset pagination: constant cost per page regardless of depth
+        analyses = query.filter(
+            tuple_(CompanyAnalysis.analysis_date, CompanyAnalysis.id) < (after_ts, after_id)
+        ).limit(per_page + 1).all()
+        has_next = len(analyses) > per_page
+        analyses = analyses[:per_page]
+        
+        return jsonify({
+            'analyses': [analysis.to_summary_dict() for analysis in analyses],
+            'next_cursor': _next_cursor(analyses[-1]) if has_next else None
+        })
+    
+    analyses = query.paginate(
         page=page, per_page=per_page, error_out=False
     )
     
     return jsonify({
-        'analyses': [analysis.to_dict() for analysis in analyses.items],
+        'analyses': [analysis.to_summary_dict() for analysis in analyses.items],
         'total': analyses.total,
         'pages': analyses.pages,
-        'current_page': page
+        'current_page': page,
+        'next_cursor': _next_cursor(analyses.items[-1]) if analyses.has_next else None
     })
 
 @analysis_bp.route('/platforms', methods=['GET'])
 def get_platforms():
     """Get list of supported AI platforms"""
-    platforms = [
-        {'name': 'ChatGPT', 'id': 'chatgpt', 'provider': 'OpenAI'},
-        {'name': 'Claude', 'id': 'claude', 'provider': 'Anthropic'},
-        {'name': 'Perplexity AI', 'id': 'perplexity', 'provider': 'Perplexity'},
-        {'name': 'Arc Search', 'id': 'arc_search', 'provider': 'The Browser Company'},
-        {'name': 'SearchGPT', 'id': 'searchgpt', 'provider': 'OpenAI'}
-    ]
-    return jsonify(platforms)
+    return _static_json_response(_PLATFORMS_BODY)
 
 @analysis_bp.route('/methodologies', methods=['GET'])
 def get_methodologies():
     """Get list of ranking methodologies"""
-    methodologies = [
-        {
-            'id': 'cidr',
-            'name': 'CIDR',
-            'full_name': 'Contextual Intent-Driven Ranking',
-            'description': 'How well do LLMs understand the intent behind queries related to this company?'
-        },
-        {
-            'id': 'scvs',
-            'name': 'SCVS',
-            'full_name': 'Source Credibility & Verifiability Score',
-            'description': 'How well is the company represented in verifiable, reputable, and cited sources?'
-        },
-        {
-            'id': 'acso',
-            'name': 'ACSO',
-            'full_name': 'Adaptive Content Structure Optimization',
-            'description': 'Is the company\'s online content structured in a way that\'s easy for AI to parse and summarize?'
-        },
-        {
-            'id': 'uifl',
-            'name': 'UIFL',
-            'full_name': 'User Interaction & Feedback Loop',
-            'description': 'How often is this company positively engaged with through AI tools (clicks, follow-ups, thumbs up)?'
-        }
-    ]
-    return jsonify(methodologies)
+    return _static_json_response(_METHODOLOGIES_BODY)
 
 @analysis_bp.route('/analyze-url', methods=['POST'])
 def analyze_url():
     """Analyze a specific URL for AI visibility factors"""
-    data = request.get_json()
-    url = data.get('url')
+    data = request.get_json(silent=True)
+    url = data.get('url') if isinstance(data, dict) else None
     
-    if not url:
+    if not url or not isinstance(url, str):
         return jsonify({'error': 'URL is required'}), 400
     
     try:
@@ -148,3 +217,22 @@ def analyze_url():
     
     except Exception as e:
         return jsonify({'error': f'An unexpected error occurred: {str(e)}'}), 500
+
+@analysis_bp.route('/analyze-urls', methods=['POST'])
+def analyze_urls():
+    """Analyze a batch of URLs concurrently"""
+    data = request.get_json(silent=True)
+    urls = data.get('urls') if isinstance(data, dict) else None
+    
+    if not urls or not isinstance(urls, list) or not all(isinstance(url, str) for url in urls):
+        return jsonify({'error': 'A list of URLs is required'}), 400
+    
+    if len(urls) > MAX_BATCH_URLS:
+        return jsonify({'error': f'At most {MAX_BATCH_URLS} URLs can be analyzed per request'}), 400
+    
+    try:
+        analyzer = URLAnalyzer()
+        return jsonify({'results': analyzer.analyze_urls(urls)})
+    
+    except Exception as e:
+        return jsonify({'error': f'An unexpected error occurred: {str(e)}'}), 500
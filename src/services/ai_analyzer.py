@@ -1,16 +1,183 @@
 import openai
-import requests
+import httpx
+import ahocorasick
+import asyncio
+import atexit
+import functools
 import json
+import os
 import re
-from typing import Dict, List, Any
-import time
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Any, NamedTuple
+from urllib.parse import urlsplit
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_random_exponential
 import random
+from src.services.event_loop import run_async
+from src.services.rate_limiter import LIMITERS, estimate_tokens, share_limits
+from src.services.llm_cache import cached_query, get_cached, set_cached
+
+OPENAI_MODEL = "gpt-4o-mini"
+PERPLEXITY_MODEL = "sonar"
+PERPLEXITY_API_URL = "https://api.perplexity.ai/chat/completions"
+MAX_TOKENS = 300
+# Kept byte-identical and first in every request so providers' prefix caches can reuse it
+SYSTEM_PROMPT = "You are a helpful assistant providing information about companies."
+# Completeness stops improving at 200 words, so plain answers are cut off once they pass it
+EARLY_STOP_WORDS = 200
+
+# Keyword groups used by the response analyzers (substring matches, each keyword counted once)
+UNCERTAINTY_WORDS = ('might', 'could', 'possibly', 'unclear', 'unknown')
+CONFIDENCE_WORDS = ('established', 'founded', 'known for', 'specializes')
+CONTEXT_WORDS = ('industry', 'market', 'competitors', 'sector', 'business')
+STRUCTURE_WORDS = ('first', 'second', 'additionally', 'furthermore', 'in conclusion')
+KEY_PHRASES = ('founded', 'established', 'specializes', 'offers', 'provides', 'known for')
+POSITIVE_WORDS = ('excellent', 'leading', 'innovative', 'successful', 'trusted', 'reliable')
+NEGATIVE_WORDS = ('poor', 'failing', 'problematic', 'controversial', 'declining')
+ACTION_WORDS = ('visit', 'contact', 'learn more', 'explore', 'discover', 'check out')
+FOLLOW_UP_WORDS = ('more information', 'details', 'specific', 'particular', 'additional')
+# API serving each platform; platforms on the same backend get identical answers to identical prompts
+PLATFORM_BACKENDS = {
+    'chatgpt': 'openai',
+    'searchgpt': 'openai',
+    'claude': 'claude',
+    'perplexity': 'perplexity',
+    'arc_search': 'arc_search'
+}
+
+CREDIBLE_DOMAINS = frozenset({'wikipedia.org', 'reuters.com', 'bloomberg.com', 'forbes.com', 'wsj.com'})
+
+KEYWORD_BUCKETS = {
+    'uncertainty': UNCERTAINTY_WORDS,
+    'confidence': CONFIDENCE_WORDS,
+    'context': CONTEXT_WORDS,
+    'structure': STRUCTURE_WORDS,
+    'key_phrases': KEY_PHRASES,
+    'positive': POSITIVE_WORDS,
+    'negative': NEGATIVE_WORDS,
+    'action': ACTION_WORDS,
+    'follow_up': FOLLOW_UP_WORDS
+}
+
+def _build_keyword_automaton() -> ahocorasick.Automaton:
+    """Aho-Corasick automaton over every keyword; values are (keyword, buckets it counts towards)"""
+    keyword_buckets: Dict[str, List[str]] = {}
+    for bucket, words in KEYWORD_BUCKETS.items():
+        for word in words:
+            keyword_buckets.setdefault(word, []).append(bucket)
+    
+    automaton = ahocorasick.Automaton()
+    for word, buckets in keyword_buckets.items():
+        automaton.add_word(word, (word, tuple(buckets)))
+    automaton.make_automaton()
+    return automaton
+
+# Built once per process; matches all keywords, overlapping ones included, in a single linear scan
+_KEYWORD_AUTOMATON = _build_keyword_automaton()
+# Parentheses are kept only when balanced (e.g. wikipedia.org/wiki/Acme_(company)), so a URL inside "(...)" drops the
+# closing one; trailing punctuation is not part of a URL. No nested repetition, so matching stays linear
+_URL_CHAR = r'[^\s<>"\'()\[\]]'
+_URL_RE = re.compile(
+    rf'https?://(?:{_URL_CHAR}|\({_URL_CHAR}*\))*(?:[^\s<>"\'()\[\].,;:!?]|\({_URL_CHAR}*\))'
+)
+_DOMAIN_RE = re.compile(r'\b(?:[a-zA-Z0-9-]+\.)+[a-zA-Z]{2,}\b')
+
+def _keyword_counts(text: str) -> Dict[str, int]:
+    """Number of distinct keywords from each bucket present in text, in one scan"""
+    counts = dict.fromkeys(KEYWORD_BUCKETS, 0)
+    for word, buckets in {value for _, value in _KEYWORD_AUTOMATON.iter(text)}:
+        for bucket in buckets:
+            counts[bucket] += 1
+    return counts
+
+class TextStats(NamedTuple):
+    """Counts the response analyzers score from"""
+    word_count: int
+    sentence_count: int
+    company_mentions: int
+    keywords: Dict[str, int]
+
+@functools.lru_cache(maxsize=1024)
+def _text_stats(response: str, company_name: str) -> TextStats:
+    """Tokenize a response once; platforms sharing a backend and methodologies reuse the result"""
+    low = response.lower()
+    return TextStats(
+        word_count=len(response.split()),
+        sentence_count=response.count('.') + 1,
+        company_mentions=low.count(company_name.lower()),
+        keywords=_keyword_counts(low)
+    )
+
+def _params_key(params: Dict[str, Any]) -> str:
+    """Stable cache key for a request body (model, prompts and options all count)"""
+    return json.dumps(params, sort_keys=True)
+
+def _is_transient(exc: BaseException) -> bool:
+    """Rate limits, timeouts, dropped connections and 5xx responses from a provider"""
+    if isinstance(exc, (openai.RateLimitError, openai.APIConnectionError, openai.InternalServerError, httpx.TransportError)):
+        return True
+    return isinstance(exc, httpx.HTTPStatusError) and (exc.response.status_code == 429 or exc.response.status_code >= 500)
+
+# Retry transient provider errors with jittered exponential backoff; each attempt goes back through the rate limiter
+_retry_transient = retry(
+    retry=retry_if_exception(_is_transient),
+    wait=wait_random_exponential(min=1, max=30),
+    stop=stop_after_attempt(5),
+    reraise=True
+)
+
+# Per-process API clients, so TLS sessions and HTTP/2 connections are reused across analyses.
+# Created on first use (after gunicorn forks); use them only from the loop in src.services.event_loop.
+_clients = None
+_clients_lock = threading.Lock()
+
+def _shared_clients() -> tuple:
+    """(AsyncOpenAI client, httpx client for direct provider calls), created once per process"""
+    global _clients
+    with _clients_lock:
+        if _clients is None:
+            openai_client = openai.AsyncOpenAI(
+                max_retries=0,  # Retried by _retry_transient instead, so every attempt is rate limited
+                http_client=openai.DefaultAsyncHttpxClient(
+                    http2=True,
+                    limits=httpx.Limits(max_keepalive_connections=64, max_connections=128)
+                )
+            )
+            http = httpx.AsyncClient(
+                http2=True,
+                timeout=30.0,
+                limits=httpx.Limits(max_keepalive_connections=32, max_connections=64)
+            )
+            _clients = (openai_client, http)
+    return _clients
+
+async def _close_clients(clients: tuple):
+    openai_client, http = clients
+    await http.aclose()
+    await openai_client.close()
+
+@atexit.register
+def _close_shared_clients():
+    if _clients is not None:
+        try:
+            run_async(_close_clients(_clients), timeout=5)
+        except Exception:
+            pass  # Exiting anyway; the OS closes the sockets
 
 class AIAnalyzer:
     def __init__(self):
-        self.openai_client = openai.OpenAI()
+        # Process-wide clients; their HTTP/2 connection pools outlive this analyzer
+        self.openai_client, self.http = _shared_clients()
+        self.perplexity_api_key = os.environ.get('PERPLEXITY_API_KEY')
         self.platforms = ['chatgpt', 'claude', 'perplexity', 'arc_search', 'searchgpt']
         self.methodologies = ['cidr', 'scvs', 'acso', 'uifl']
+        self._methodology_dispatch = {
+            'cidr': self._calculate_cidr_score,
+            'scvs': self._calculate_scvs_score,
+            'acso': self._calculate_acso_score,
+            'uifl': self._calculate_uifl_score
+        }
         
         # Query templates for different analysis types
         self.query_templates = {
@@ -21,87 +188,100 @@ class AIAnalyzer:
             'reputation': "What is {company}'s reputation in the market?",
             'products': "What are {company}'s main products or services?"
         }
+        
+        # Prompts sent by each methodology
+        self.cidr_queries = [
+            "What does {company} do?",
+            "Tell me about {company}'s services",
+            "What is {company} known for?",
+            "How does {company} compare to competitors?"
+        ]
+        self.methodology_queries = {
+            'scvs': "List reliable and credible sources for information about {company}",
+            'acso': "Analyze the structure and organization of {company}'s online content",
+            'uifl': "How engaging and actionable is information about {company}?"
+        }
     
-    def analyze_company(self, company_name: str) -> Dict[str, Any]:
+    async def analyze_company(self, company_name: str) -> Dict[str, Any]:
         """Main method to analyze a company across all platforms and methodologies"""
         print(f"Starting analysis for company: {company_name}")
         
-        platform_scores = {}
-        overall_insights = []
-        
-        for platform in self.platforms:
-            print(f"Analyzing platform: {platform}")
-            platform_scores[platform] = self._analyze_platform(company_name, platform)
-            time.sleep(1)  # Rate limiting
+        # Phase 1: send each distinct (backend, prompts) request once, all concurrently
+        plan = {
+            (platform, methodology): (PLATFORM_BACKENDS[platform], self._methodology_queries(methodology, company_name))
+            for platform in self.platforms
+            for methodology in self.methodologies
+        }
+        unique = list(dict.fromkeys(plan.values()))
+        results = await asyncio.gather(
+            *[self._fetch_responses(backend, queries, company_name) for backend, queries in unique]
+        )
+        responses = dict(zip(unique, results))
+        
+        # Phase 2: score from the collected responses (no I/O) into a platforms x methodologies grid
+        results = [
+            self._analyze_platform(company_name, platform, {
+                methodology: (plan[platform, methodology][1], responses[plan[platform, methodology]])
+                for methodology in self.methodologies
+            })
+            for platform in self.platforms
+        ]
+        scores = [[score for score, _ in row] for row in results]
         
         # Generate overall insights
-        insights = self._generate_insights(company_name, platform_scores)
+        insights = self._generate_insights(company_name, scores)
+        
+        # Nested dicts only for the JSON-facing result
+        platform_scores = {
+            platform: {
+                methodology: {'score': score, 'comment': comment}
+                for methodology, (score, comment) in zip(self.methodologies, row)
+            }
+            for platform, row in zip(self.platforms, results)
+        }
         
         return {
             'platform_scores': platform_scores,
             'insights': insights
         }
     
-    def _analyze_platform(self, company_name: str, platform: str) -> Dict[str, Any]:
-        """Analyze a company on a specific platform"""
-        scores = {}
-        
-        for methodology in self.methodologies:
-            score, comment = self._calculate_methodology_score(company_name, platform, methodology)
-            scores[methodology] = {
-                'score': score,
-                'comment': comment
-            }
-        
-        return scores
-    
-    def _calculate_methodology_score(self, company_name: str, platform: str, methodology: str) -> tuple:
-        """Calculate score for a specific methodology on a platform"""
-        
+    def _methodology_queries(self, methodology: str, company_name: str) -> tuple:
+        """Prompts a methodology sends to each platform"""
         if methodology == 'cidr':
-            return self._calculate_cidr_score(company_name, platform)
-        elif methodology == 'scvs':
-            return self._calculate_scvs_score(company_name, platform)
-        elif methodology == 'acso':
-            return self._calculate_acso_score(company_name, platform)
-        elif methodology == 'uifl':
-            return self._calculate_uifl_score(company_name, platform)
-        else:
+            return tuple(template.format(company=company_name) for template in self.cidr_queries)
+        return (self.methodology_queries[methodology].format(company=company_name),)
+    
+    async def _fetch_responses(self, backend: str, queries: tuple, company_name: str) -> List[str]:
+        """Responses from a backend to a methodology's prompts"""
+        if len(queries) > 1:
+            return await self._query_backend_batch(backend, list(queries), company_name)
+        return [await self._query_backend(backend, queries[0], company_name)]
+    
+    def _analyze_platform(self, company_name: str, platform: str, answers: Dict[str, tuple]) -> List[tuple]:
+        """(score, comment) per methodology, in methodology order, from a platform's (queries, responses)"""
+        print(f"Analyzing platform: {platform}")
+        return [
+            self._calculate_methodology_score(company_name, methodology, *answers[methodology])
+            for methodology in self.methodologies
+        ]
+    
+    def _calculate_methodology_score(self, company_name: str, methodology: str, queries: tuple, responses: List[str]) -> tuple:
+        """Calculate score for a specific methodology from a platform's responses"""
+        calculate = self._methodology_dispatch.get(methodology)
+        if calculate is None:
             return 0, "Unknown methodology"
+        return calculate(company_name, queries, responses)
     
-    def _calculate_cidr_score(self, company_name: str, platform: str) -> tuple:
+    def _calculate_cidr_score(self, company_name: str, queries: tuple, responses: List[str]) -> tuple:
         """Calculate Contextual Intent-Driven Ranking score"""
         try:
-            # Generate diverse queries about the company
-            queries = [
-                f"What does {company_name} do?",
-                f"Tell me about {company_name}'s services",
-                f"What is {company_name} known for?",
-                f"How does {company_name} compare to competitors?"
-            ]
-            
             total_score = 0
-            responses = []
             
-            for query in queries:
-                if platform in ['chatgpt', 'searchgpt']:
-                    response = self._query_openai(query, company_name)
-                elif platform == 'claude':
-                    response = self._query_claude(query, company_name)
-                elif platform == 'perplexity':
-                    response = self._query_perplexity(query, company_name)
-                else:  # arc_search - simulated
-                    response = self._simulate_arc_search(query, company_name)
-                
-                responses.append(response)
-                
+            for query, response in zip(queries, responses):
                 # Analyze response quality
-                relevance = self._analyze_relevance(response, company_name, query)
-                completeness = self._analyze_completeness(response)
-                accuracy = self._analyze_accuracy(response, company_name)
-                context = self._analyze_context(response, company_name)
+                scores = self._score_response(response, company_name, query)
                 
-                query_score = (relevance + completeness + accuracy + context) / 4
+                query_score = (scores['relevance'] + scores['completeness'] + scores['accuracy'] + scores['context']) / 4
                 total_score += query_score
             
             final_score = min(100, max(0, total_score / len(queries)))
@@ -112,19 +292,10 @@ class AIAnalyzer:
         except Exception as e:
             return 0, f"Error calculating CIDR score: {str(e)}"
     
-    def _calculate_scvs_score(self, company_name: str, platform: str) -> tuple:
+    def _calculate_scvs_score(self, company_name: str, queries: tuple, responses: List[str]) -> tuple:
         """Calculate Source Credibility & Verifiability Score"""
         try:
-            query = f"List reliable and credible sources for information about {company_name}"
-            
-            if platform in ['chatgpt', 'searchgpt']:
-                response = self._query_openai(query, company_name)
-            elif platform == 'claude':
-                response = self._query_claude(query, company_name)
-            elif platform == 'perplexity':
-                response = self._query_perplexity(query, company_name)
-            else:  # arc_search - simulated
-                response = self._simulate_arc_search(query, company_name)
+            response = responses[0]
             
             # Extract and analyze sources
             sources = self._extract_sources(response)
@@ -139,24 +310,16 @@ class AIAnalyzer:
         except Exception as e:
             return 0, f"Error calculating SCVS score: {str(e)}"
     
-    def _calculate_acso_score(self, company_name: str, platform: str) -> tuple:
+    def _calculate_acso_score(self, company_name: str, queries: tuple, responses: List[str]) -> tuple:
         """Calculate Adaptive Content Structure Optimization score"""
         try:
-            query = f"Analyze the structure and organization of {company_name}'s online content"
-            
-            if platform in ['chatgpt', 'searchgpt']:
-                response = self._query_openai(query, company_name)
-            elif platform == 'claude':
-                response = self._query_claude(query, company_name)
-            elif platform == 'perplexity':
-                response = self._query_perplexity(query, company_name)
-            else:  # arc_search - simulated
-                response = self._simulate_arc_search(query, company_name)
+            query, response = queries[0], responses[0]
             
             # Analyze content structure indicators
-            readability = self._analyze_readability(response)
-            structure = self._analyze_structure_quality(response)
-            summarizability = self._analyze_summarizability(response)
+            scores = self._score_response(response, company_name, query)
+            readability = scores['readability']
+            structure = scores['structure']
+            summarizability = scores['summarizability']
             
             final_score = (readability + structure + summarizability) / 3
             comment = f"Content structure analysis. Readability: {readability:.1f}, Structure: {structure:.1f}, Summarizability: {summarizability:.1f}"
@@ -166,24 +329,16 @@ class AIAnalyzer:
         except Exception as e:
             return 0, f"Error calculating ACSO score: {str(e)}"
     
-    def _calculate_uifl_score(self, company_name: str, platform: str) -> tuple:
+    def _calculate_uifl_score(self, company_name: str, queries: tuple, responses: List[str]) -> tuple:
         """Calculate User Interaction & Feedback Loop score"""
         try:
-            query = f"How engaging and actionable is information about {company_name}?"
-            
-            if platform in ['chatgpt', 'searchgpt']:
-                response = self._query_openai(query, company_name)
-            elif platform == 'claude':
-                response = self._query_claude(query, company_name)
-            elif platform == 'perplexity':
-                response = self._query_perplexity(query, company_name)
-            else:  # arc_search - simulated
-                response = self._simulate_arc_search(query, company_name)
+            query, response = queries[0], responses[0]
             
             # Analyze engagement potential
-            positivity = self._analyze_sentiment(response)
-            actionability = self._analyze_actionability(response)
-            follow_up_potential = self._analyze_follow_up_potential(response)
+            scores = self._score_response(response, company_name, query)
+            positivity = scores['positivity']
+            actionability = scores['actionability']
+            follow_up_potential = scores['follow_up']
             
             final_score = (positivity + actionability + follow_up_potential) / 3
             comment = f"Engagement analysis. Positivity: {positivity:.1f}, Actionability: {actionability:.1f}, Follow-up potential: {follow_up_potential:.1f}"
@@ -193,51 +348,239 @@ class AIAnalyzer:
         except Exception as e:
             return 0, f"Error calculating UIFL score: {str(e)}"
     
-    def _query_openai(self, query: str, company_name: str) -> str:
+    async def _query_backend(self, backend: str, query: str, company_name: str) -> str:
+        """Send a query to the given backend"""
+        if backend == 'openai':
+            return await self._query_openai(query, company_name)
+        elif backend == 'claude':
+            return await self._query_claude(query, company_name)
+        elif backend == 'perplexity':
+            return await self._query_perplexity(query, company_name)
+        else:  # arc_search - simulated
+            return self._simulate_arc_search(query, company_name)
+    
+    async def _query_backend_batch(self, backend: str, queries: List[str], company_name: str) -> List[str]:
+        """Send several queries to a backend, in a single request where the API allows it"""
+        if backend == 'openai':
+            params, keys = self._openai_batch_params(queries, company_name)
+            try:
+                parsed = json.loads(await self._cached_openai(params))
+                return [str(parsed[key]) for key in keys]
+            except (openai.OpenAIError, httpx.HTTPError, ValueError, KeyError, TypeError):
+                pass  # Fall back to one request per query
+        
+        return await asyncio.gather(
+            *[self._query_backend(backend, query, company_name) for query in queries]
+        )
+    
+    def _openai_params(self, query: str, max_tokens: int = MAX_TOKENS, json_mode: bool = False) -> Dict[str, Any]:
+        """Chat completion request body for a query"""
+        params = {
+            "model": OPENAI_MODEL,
+            "messages": [
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": query}
+            ],
+            "max_tokens": max_tokens,
+            "temperature": 0.7
+        }
+        if json_mode:
+            params["response_format"] = {"type": "json_object"}
+        return params
+    
+    def _openai_batch_params(self, queries: List[str], company_name: str) -> tuple:
+        """Request body asking several questions at once in JSON mode, plus the answer keys"""
+        keys = [f"q{i}" for i in range(1, len(queries) + 1)]
+        prompt = (
+            f"Answer each of the following {len(queries)} questions about {company_name}. "
+            f"Respond in JSON with keys {', '.join(keys)}, each holding the full answer as a string:\n"
+            + "\n".join(f"{i}) {query}" for i, query in enumerate(queries, 1))
+        )
+        return self._openai_params(prompt, max_tokens=MAX_TOKENS * len(queries), json_mode=True), keys
+    
+    def _openai_requests(self, company_name: str) -> List[tuple]:
+        """(methodology, request body) for every OpenAI call an analysis of this company makes"""
+        cidr_queries = [template.format(company=company_name) for template in self.cidr_queries]
+        bodies = [('cidr', self._openai_batch_params(cidr_queries, company_name)[0])]
+        for methodology, template in self.methodology_queries.items():
+            bodies.append((methodology, self._openai_params(template.format(company=company_name))))
+        return bodies
+    
+    async def _query_openai(self, query: str, company_name: str) -> str:
         """Query OpenAI API"""
         try:
-            response = self.openai_client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[
-                    {"role": "system", "content": "You are a helpful assistant providing information about companies."},
-                    {"role": "user", "content": query}
-                ],
-                max_tokens=500,
-                temperature=0.7
-            )
-            return response.choices[0].message.content
-        except Exception as e:
+            return await self._cached_openai(self._openai_params(query))
+        except (openai.OpenAIError, httpx.HTTPError) as e:
             return f"Error querying OpenAI: {str(e)}"
     
-    def _query_claude(self, query: str, company_name: str) -> str:
+    async def _cached_openai(self, params: Dict[str, Any]) -> str:
+        """Chat completion cached on the full request body"""
+        return await cached_query("openai", _params_key(params), lambda: self._openai_completion(params))
+    
+    @_retry_transient
+    async def _openai_completion(self, params: Dict[str, Any]) -> str:
+        """Send a single chat completion request through the rate limiter"""
+        limiter = LIMITERS['openai']
+        prompt = params["messages"][-1]["content"]
+        await limiter.acquire(estimate_tokens(prompt, params["max_tokens"]))
+        rate_limited = False
+        try:
+            # JSON-mode answers have to be complete to parse
+            if "response_format" in params:
+                response = await self.openai_client.chat.completions.create(**params)
+                return response.choices[0].message.content
+            return await self._stream_openai(params)
+        except openai.RateLimitError:
+            rate_limited = True
+            raise
+        finally:
+            limiter.release(rate_limited)
+    
+    async def _stream_openai(self, params: Dict[str, Any]) -> str:
+        """Stream a completion, cancelling it once the answer is long enough to score"""
+        stream = await self.openai_client.chat.completions.create(**params, stream=True)
+        content = ""
+        try:
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    content += chunk.choices[0].delta.content
+                    if len(content.split()) > EARLY_STOP_WORDS:
+                        break
+        finally:
+            await stream.close()
+        return content
+    
+    async def analyze_company_batch(self, company_names: List[str], poll_interval: float = 30) -> Dict[str, Dict[str, Any]]:
+        """Analyze companies through the OpenAI Batch API (half price, up to 24h turnaround)"""
+        # Repeated names would submit duplicate custom_ids, which the Batch API rejects
+        company_names = list(dict.fromkeys(company_names))
+        pending = {}
+        lines = []
+        for position, company_name in enumerate(company_names):
+            for index, (methodology, params) in enumerate(self._openai_requests(company_name)):
+                key = _params_key(params)
+                if get_cached("openai", key) is not None:
+                    continue
+                # Built from positions rather than the name, so no company name can collide with or corrupt another id
+                custom_id = f"{position}|{methodology}|{index}"
+                pending[custom_id] = key
+                lines.append(json.dumps({"custom_id": custom_id, "method": "POST", "url": "/v1/chat/completions", "body": params}))
+        
+        if lines:
+            batch_file = await self.openai_client.files.create(
+                file=("analyses.jsonl", "\n".join(lines).encode()), purpose="batch"
+            )
+            batch = await self.openai_client.batches.create(
+                input_file_id=batch_file.id, endpoint="/v1/chat/completions", completion_window="24h"
+            )
+            print(f"Submitted batch {batch.id} with {len(lines)} requests")
+            
+            # Poll with exponential backoff until the batch reaches a terminal state
+            delay = poll_interval
+            while batch.status not in ("completed", "failed", "expired", "cancelled"):
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 600)
+                batch = await self.openai_client.batches.retrieve(batch.id)
+            
+            if batch.output_file_id:
+                output = await self.openai_client.files.content(batch.output_file_id)
+                for line in output.text.splitlines():
+                    result = json.loads(line)
+                    response = result.get("response") or {}
+                    if result.get("custom_id") in pending and response.get("status_code") == 200:
+                        set_cached("openai", pending[result["custom_id"]], response["body"]["choices"][0]["message"]["content"])
+        
+        # Score from the warmed cache; anything the batch did not return is requested live
+        return {company_name: await self.analyze_company(company_name) for company_name in company_names}
+    
+    async def _query_claude(self, query: str, company_name: str) -> str:
         """Query Claude API (simulated for now)"""
-        # Note: This would require Anthropic API key and proper implementation
+        # Note: This would require Anthropic API key and proper implementation; real calls go through cached_query
+        return self._simulate_claude(query, company_name)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _simulate_claude(query: str, company_name: str) -> str:
+        """Simulate Claude response"""
         return f"Simulated Claude response for: {query}. Claude would provide detailed analysis about {company_name} with focus on accuracy and helpfulness."
     
-    def _query_perplexity(self, query: str, company_name: str) -> str:
-        """Query Perplexity API (simulated for now)"""
-        # Note: This would require Perplexity API key and proper implementation
+    async def _query_perplexity(self, query: str, company_name: str) -> str:
+        """Query Perplexity API (simulated when PERPLEXITY_API_KEY is not set)"""
+        if not self.perplexity_api_key:
+            return self._simulate_perplexity(query, company_name)
+        
+        params = {
+            "model": PERPLEXITY_MODEL,
+            "messages": [
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": query}
+            ],
+            "max_tokens": MAX_TOKENS
+        }
+        try:
+            return await cached_query("perplexity", _params_key(params), lambda: self._perplexity_completion(params))
+        except (httpx.HTTPError, ValueError, KeyError) as e:
+            return f"Error querying Perplexity: {str(e)}"
+    
+    @_retry_transient
+    async def _perplexity_completion(self, params: Dict[str, Any]) -> str:
+        """Send a single chat completion request to Perplexity through the rate limiter"""
+        limiter = LIMITERS['perplexity']
+        await limiter.acquire(estimate_tokens(params["messages"][-1]["content"], params["max_tokens"]))
+        rate_limited = False
+        try:
+            response = await self.http.post(
+                PERPLEXITY_API_URL,
+                json=params,
+                headers={"Authorization": f"Bearer {self.perplexity_api_key}"}
+            )
+            rate_limited = response.status_code == 429
+            response.raise_for_status()
+        finally:
+            limiter.release(rate_limited)
+        return response.json()["choices"][0]["message"]["content"]
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _simulate_perplexity(query: str, company_name: str) -> str:
+        """Simulate Perplexity response"""
         return f"Simulated Perplexity response for: {query}. Perplexity would provide search-grounded information about {company_name} with citations."
     
-    def _simulate_arc_search(self, query: str, company_name: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _simulate_arc_search(query: str, company_name: str) -> str:
         """Simulate Arc Search response"""
         return f"Simulated Arc Search response for: {query}. Arc Search would provide browser-integrated search results about {company_name}."
     
     # Analysis helper methods
-    def _analyze_relevance(self, response: str, company_name: str, query: str) -> float:
-        """Analyze how relevant the response is to the query"""
-        company_mentions = response.lower().count(company_name.lower())
-        response_length = len(response.split())
+    def _score_response(self, response: str, company_name: str, query: str) -> Dict[str, float]:
+        """Compute every lexical sub-score for a response from a single pass over it"""
+        stats = _text_stats(response, company_name)
+        counts = stats.keywords
         
-        if response_length == 0:
+        return {
+            'relevance': self._analyze_relevance(stats.company_mentions, stats.word_count),
+            'completeness': self._analyze_completeness(stats.word_count),
+            'accuracy': self._analyze_accuracy(counts),
+            'context': min(100, counts['context'] * 20),
+            'readability': self._analyze_readability(stats.sentence_count, stats.word_count),
+            'structure': min(100, counts['structure'] * 25 + 50),
+            'summarizability': min(100, counts['key_phrases'] * 20 + 40),
+            'positivity': self._analyze_sentiment(counts),
+            'actionability': min(100, counts['action'] * 30 + 50),
+            'follow_up': min(100, counts['follow_up'] * 25 + 60)
+        }
+    
+    def _analyze_relevance(self, company_mentions: int, word_count: int) -> float:
+        """Analyze how relevant the response is to the query"""
+        if word_count == 0:
             return 0
         
-        relevance_ratio = min(1.0, company_mentions / max(1, response_length / 50))
+        relevance_ratio = min(1.0, company_mentions / max(1, word_count / 50))
         return relevance_ratio * 100
     
-    def _analyze_completeness(self, response: str) -> float:
+    def _analyze_completeness(self, word_count: int) -> float:
         """Analyze completeness of the response"""
-        word_count = len(response.split())
         # Assume 50-200 words is a complete response
         if word_count < 20:
             return 30
@@ -248,47 +591,34 @@ class AIAnalyzer:
         else:
             return 100
     
-    def _analyze_accuracy(self, response: str, company_name: str) -> float:
-        """Analyze accuracy indicators in the response"""
-        # Look for uncertainty indicators
-        uncertainty_words = ['might', 'could', 'possibly', 'unclear', 'unknown']
-        uncertainty_count = sum(1 for word in uncertainty_words if word in response.lower())
-        
-        # Look for confidence indicators
-        confidence_words = ['established', 'founded', 'known for', 'specializes']
-        confidence_count = sum(1 for word in confidence_words if word in response.lower())
-        
-        if uncertainty_count > confidence_count:
+    def _analyze_accuracy(self, counts: Dict[str, int]) -> float:
+        """Analyze accuracy indicators (uncertainty vs confidence wording)"""
+        if counts['uncertainty'] > counts['confidence']:
             return 60
         else:
             return 85
     
-    def _analyze_context(self, response: str, company_name: str) -> float:
-        """Analyze contextual understanding"""
-        context_indicators = ['industry', 'market', 'competitors', 'sector', 'business']
-        context_count = sum(1 for indicator in context_indicators if indicator in response.lower())
-        
-        return min(100, context_count * 20)
-    
     def _extract_sources(self, response: str) -> List[str]:
-        """Extract sources from response"""
-        # Simple URL extraction
-        url_pattern = r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+'
-        urls = re.findall(url_pattern, response)
+        """Extract distinct sources (URLs and bare domain names) from response"""
+        urls = _URL_RE.findall(response)
         
-        # Extract domain names mentioned
-        domain_pattern = r'\b(?:[a-zA-Z0-9-]+\.)+[a-zA-Z]{2,}\b'
-        domains = re.findall(domain_pattern, response)
+        # Domain names mentioned outside of the URLs already captured
+        domains = _DOMAIN_RE.findall(_URL_RE.sub(' ', response))
         
-        return urls + domains
+        return list(dict.fromkeys(urls + domains))
+    
+    def _is_credible_source(self, source: str) -> bool:
+        """Whether a URL or domain belongs to a credible domain (subdomains included)"""
+        host = (urlsplit(source).hostname or '') if '://' in source else source.lower()
+        labels = host.split('.')
+        return any('.'.join(labels[i:]) in CREDIBLE_DOMAINS for i in range(len(labels) - 1))
     
     def _analyze_source_credibility(self, sources: List[str]) -> float:
         """Analyze credibility of sources"""
         if not sources:
             return 40
         
-        credible_domains = ['wikipedia.org', 'reuters.com', 'bloomberg.com', 'forbes.com', 'wsj.com']
-        credible_count = sum(1 for source in sources if any(domain in source.lower() for domain in credible_domains))
+        credible_count = sum(1 for source in sources if self._is_credible_source(source))
         
         return min(100, (credible_count / len(sources)) * 100 + 40)
     
@@ -300,15 +630,12 @@ class AIAnalyzer:
         # Assume sources are verifiable if they're from known domains
         return min(100, len(sources) * 15 + 40)
     
-    def _analyze_readability(self, response: str) -> float:
+    def _analyze_readability(self, sentence_count: int, word_count: int) -> float:
         """Analyze readability of content"""
-        sentences = response.split('.')
-        words = response.split()
-        
-        if not sentences or not words:
+        if not word_count:
             return 50
         
-        avg_sentence_length = len(words) / len(sentences)
+        avg_sentence_length = word_count / sentence_count
         
         # Optimal sentence length is 15-20 words
         if 10 <= avg_sentence_length <= 25:
@@ -318,60 +645,24 @@ class AIAnalyzer:
         else:
             return 50
     
-    def _analyze_structure_quality(self, response: str) -> float:
-        """Analyze structure quality"""
-        # Look for structure indicators
-        structure_indicators = ['first', 'second', 'additionally', 'furthermore', 'in conclusion']
-        structure_count = sum(1 for indicator in structure_indicators if indicator in response.lower())
-        
-        return min(100, structure_count * 25 + 50)
-    
-    def _analyze_summarizability(self, response: str) -> float:
-        """Analyze how easily content can be summarized"""
-        # Look for key information density
-        key_phrases = ['founded', 'established', 'specializes', 'offers', 'provides', 'known for']
-        key_count = sum(1 for phrase in key_phrases if phrase in response.lower())
-        
-        return min(100, key_count * 20 + 40)
-    
-    def _analyze_sentiment(self, response: str) -> float:
+    def _analyze_sentiment(self, counts: Dict[str, int]) -> float:
         """Analyze sentiment of the response"""
-        positive_words = ['excellent', 'leading', 'innovative', 'successful', 'trusted', 'reliable']
-        negative_words = ['poor', 'failing', 'problematic', 'controversial', 'declining']
-        
-        positive_count = sum(1 for word in positive_words if word in response.lower())
-        negative_count = sum(1 for word in negative_words if word in response.lower())
-        
-        if positive_count > negative_count:
+        if counts['positive'] > counts['negative']:
             return 80
-        elif negative_count > positive_count:
+        elif counts['negative'] > counts['positive']:
             return 40
         else:
             return 60
     
-    def _analyze_actionability(self, response: str) -> float:
-        """Analyze actionability of the response"""
-        action_words = ['visit', 'contact', 'learn more', 'explore', 'discover', 'check out']
-        action_count = sum(1 for word in action_words if word in response.lower())
-        
-        return min(100, action_count * 30 + 50)
-    
-    def _analyze_follow_up_potential(self, response: str) -> float:
-        """Analyze follow-up potential"""
-        follow_up_indicators = ['more information', 'details', 'specific', 'particular', 'additional']
-        follow_up_count = sum(1 for indicator in follow_up_indicators if indicator in response.lower())
-        
-        return min(100, follow_up_count * 25 + 60)
-    
-    def _generate_insights(self, company_name: str, platform_scores: Dict) -> str:
-        """Generate overall insights from the analysis"""
+    def _generate_insights(self, company_name: str, grid: List[List[float]]) -> str:
+        """Generate overall insights from the platforms x methodologies score grid"""
         insights = []
         
-        # Calculate average scores per methodology
-        methodology_averages = {}
-        for methodology in self.methodologies:
-            total = sum(platform_scores[platform][methodology]['score'] for platform in self.platforms)
-            methodology_averages[methodology] = total / len(self.platforms)
+        # Calculate average scores per methodology (columns)
+        methodology_averages = {
+            methodology: sum(column) / len(self.platforms)
+            for methodology, column in zip(self.methodologies, zip(*grid))
+        }
         
         # Find best and worst performing methodologies
         best_methodology = max(methodology_averages, key=methodology_averages.get)
@@ -380,11 +671,11 @@ class AIAnalyzer:
         insights.append(f"{company_name} performs best in {best_methodology.upper()} with an average score of {methodology_averages[best_methodology]:.1f}/100.")
         insights.append(f"The area needing most improvement is {worst_methodology.upper()} with an average score of {methodology_averages[worst_methodology]:.1f}/100.")
         
-        # Platform analysis
-        platform_averages = {}
-        for platform in self.platforms:
-            total = sum(platform_scores[platform][methodology]['score'] for methodology in self.methodologies)
-            platform_averages[platform] = total / len(self.methodologies)
+        # Platform analysis (rows)
+        platform_averages = {
+            platform: sum(row) / len(self.methodologies)
+            for platform, row in zip(self.platforms, grid)
+        }
         
         best_platform = max(platform_averages, key=platform_averages.get)
         worst_platform = min(platform_averages, key=platform_averages.get)
@@ -394,3 +685,30 @@ class AIAnalyzer:
         
         return " ".join(insights)
 
+def _analyze_shard(company_names: List[str]) -> List[Dict[str, Any]]:
+    """Worker-process entry point: analyze a shard of companies concurrently on the worker's loop"""
+    async def analyze_all():
+        analyzer = AIAnalyzer()
+        return await asyncio.gather(*[analyzer.analyze_company(name) for name in company_names])
+    return run_async(analyze_all())
+
+def analyze_companies(company_names: List[str], max_workers: int = None) -> Dict[str, Dict[str, Any]]:
+    """Analyze many companies for offline jobs, sharded across CPU cores.
+    
+    Workers are spawned, so callers must run this under an `if __name__ == "__main__":` guard.
+    Each worker gets an even share of the provider rate limits; set REDIS_URL so the LLM cache is shared too.
+    """
+    workers = max(1, min(max_workers or os.cpu_count() or 1, len(company_names)))
+    shards = [company_names[i::workers] for i in range(workers)]
+    
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context('spawn'),
+        initializer=share_limits,
+        initargs=(workers,)
+    ) as pool:
+        results = {}
+        for shard, analyses in zip(shards, pool.map(_analyze_shard, shards)):
+            results.update(zip(shard, analyses))
+    return {name: results[name] for name in company_names}
+
@@ -0,0 +1,19 @@
+import asyncio
+import threading
+
+# One event loop per worker process, so async clients (and their pooled connections) outlive a request
+_loop = None
+_lock = threading.Lock()
+
+def get_loop() -> asyncio.AbstractEventLoop:
+    """Return the process-wide event loop, starting it in a daemon thread on first use"""
+    global _loop
+    with _lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name='async-io', daemon=True).start()
+    return _loop
+
+def run_async(coro, timeout: float = None):
+    """Run a coroutine on the process-wide loop from sync code and return its result"""
+    return asyncio.run_coroutine_threadsafe(coro, get_loop()).result(timeout)
@@ -0,0 +1,37 @@
+from cachelib import RedisCache, SimpleCache
+from typing import Awaitable, Callable
+import hashlib
+import os
+import redis
+
+LLM_CACHE_TTL = 86400  # 24 hours, matching how long an analysis is reused
+
+# Redis when available (shared across workers), in-process otherwise
+redis_url = os.environ.get("REDIS_URL")
+
+if redis_url:
+    _backend = RedisCache(host=redis.from_url(redis_url), key_prefix='llm/')
+else:
+    _backend = SimpleCache(threshold=10000)
+
+def _cache_key(namespace: str, query: str) -> str:
+    return hashlib.sha256(f"{namespace}\0{query}".encode()).hexdigest()
+
+def get_cached(namespace: str, query: str):
+    """Return the cached response for (namespace, query), or None"""
+    return _backend.get(_cache_key(namespace, query))
+
+def set_cached(namespace: str, query: str, response: str, ttl: int = LLM_CACHE_TTL):
+    """Store a response fetched elsewhere (e.g. from a batch job)"""
+    _backend.set(_cache_key(namespace, query), response, timeout=ttl)
+
+async def cached_query(namespace: str, query: str, fetch: Callable[[], Awaitable[str]], ttl: int = LLM_CACHE_TTL) -> str:
+    """Return the cached response for (namespace, query), calling `fetch` on a miss.
+
+    Exceptions from `fetch` propagate and nothing is cached, so failed calls are retried next time.
+    """
+    response = get_cached(namespace, query)
+    if response is None:
+        response = await fetch()
+        set_cached(namespace, query, response, ttl)
+    return response
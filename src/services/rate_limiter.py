@@ -0,0 +1,89 @@
+import asyncio
+import threading
+import time
+from collections import deque
+
+# Per-provider account limits (requests and tokens per minute) and concurrency caps
+PROVIDER_LIMITS = {
+    'openai': {'rpm': 60, 'tpm': 150_000, 'max_concurrency': 8},
+    'anthropic': {'rpm': 50, 'tpm': 80_000, 'max_concurrency': 8},
+    'perplexity': {'rpm': 50, 'tpm': 100_000, 'max_concurrency': 8}
+}
+
+def estimate_tokens(text: str, max_tokens: int = 0) -> int:
+    """Rough token estimate (~4 chars/token) plus the completion budget, which counts towards TPM"""
+    return len(text) // 4 + max_tokens
+
+class RateLimiter:
+    """Sliding-window RPM/TPM limiter; concurrency halves on 429s and regrows by one per good minute"""
+
+    def __init__(self, rpm: int, tpm: int, max_concurrency: int, window: float = 60.0):
+        self.rpm = rpm
+        self.tpm = tpm
+        self.window = window
+        self.max_concurrency = max_concurrency
+        self.concurrency = float(max_concurrency)
+        self.in_flight = 0
+        self.request_times = deque()
+        self.token_window = deque()  # (timestamp, tokens)
+        self.tokens_in_window = 0
+        self._last_increase = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _prune(self, now: float):
+        cutoff = now - self.window
+        while self.request_times and self.request_times[0] <= cutoff:
+            self.request_times.popleft()
+        while self.token_window and self.token_window[0][0] <= cutoff:
+            self.tokens_in_window -= self.token_window.popleft()[1]
+
+    def _try_acquire(self, est_tokens: int) -> float:
+        """Reserve capacity and return 0, or return how long to wait before retrying"""
+        with self._lock:
+            now = time.monotonic()
+            self._prune(now)
+
+            if len(self.request_times) >= self.rpm:
+                return self.request_times[0] + self.window - now
+            # A single request larger than the TPM budget is let through once the window is empty
+            if self.token_window and self.tokens_in_window + est_tokens > self.tpm:
+                return self.token_window[0][0] + self.window - now
+            if self.in_flight >= int(self.concurrency):
+                return 0.05
+
+            self.request_times.append(now)
+            self.token_window.append((now, est_tokens))
+            self.tokens_in_window += est_tokens
+            self.in_flight += 1
+            return 0
+
+    async def acquire(self, est_tokens: int):
+        """Wait until a request of `est_tokens` fits within the limits"""
+        while True:
+            wait = self._try_acquire(est_tokens)
+            if not wait:
+                return
+            await asyncio.sleep(max(wait, 0.01))
+
+    def release(self, rate_limited: bool = False):
+        """Return a slot; rate_limited=True multiplicatively backs off concurrency"""
+        with self._lock:
+            self.in_flight -= 1
+            now = time.monotonic()
+            if rate_limited:
+                self.concurrency = max(1.0, self.concurrency * 0.5)
+                self._last_increase = now
+            elif now - self._last_increase >= self.window:
+                self.concurrency = min(self.max_concurrency, self.concurrency + 1)
+                self._last_increase = now
+
+# Shared per process: the limits apply to the whole account, not a single analysis.
+# Multi-process servers call share_limits() in each worker (see gunicorn.conf.py post_fork).
+LIMITERS = {provider: RateLimiter(**limits) for provider, limits in PROVIDER_LIMITS.items()}
+
+def share_limits(processes: int):
+    """Give this process an even share of the account limits when `processes` run side by side"""
+    for provider, limiter in LIMITERS.items():
+        limits = PROVIDER_LIMITS[provider]
+        limiter.rpm = max(1, limits['rpm'] // processes)
+        limiter.tpm = max(1, limits['tpm'] // processes)
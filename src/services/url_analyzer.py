@@ -1,33 +1,231 @@
-import requests
-from bs4 import BeautifulSoup
+import ahocorasick
+import httpx
+from selectolax.lexbor import LexborHTMLParser
 import re
-import nltk
-from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize, sent_tokenize
-from collections import Counter
 from urllib.parse import urlparse
+import asyncio
+import atexit
+import bisect
 import datetime
-
-# Download necessary NLTK data (only once)
-try:
-    nltk.data.find('tokenizers/punkt_tab')
-except (LookupError, Exception):
-    nltk.download('punkt_tab')
-try:
-    nltk.data.find('corpora/stopwords')
-except (LookupError, Exception):
-    nltk.download('stopwords')
+from email.utils import parsedate_to_datetime
+import functools
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from src.services.event_loop import run_async
+
+# NLTK's English stopword list, inlined so import needs neither the corpus download nor the network
+STOP_WORDS = frozenset((
+    'i', 'me', 'my', 'myself', 'we', 'our', 'ours', 'ourselves', 'you', "you're", "you've",
+    "you'll", "you'd", 'your', 'yours', 'yourself', 'yourselves', 'he', 'him', 'his', 'himself',
+    'she', "she's", 'her', 'hers', 'herself', 'it', "it's", 'its', 'itself', 'they', 'them',
+    'their', 'theirs', 'themselves', 'what', 'which', 'who', 'whom', 'this', 'that', "that'll",
+    'these', 'those', 'am', 'is', 'are', 'was', 'were', 'be', 'been', 'being', 'have', 'has',
+    'had', 'having', 'do', 'does', 'did', 'doing', 'a', 'an', 'the', 'and', 'but', 'if', 'or',
+    'because', 'as', 'until', 'while', 'of', 'at', 'by', 'for', 'with', 'about', 'against',
+    'between', 'into', 'through', 'during', 'before', 'after', 'above', 'below', 'to', 'from',
+    'up', 'down', 'in', 'out', 'on', 'off', 'over', 'under', 'again', 'further', 'then', 'once',
+    'here', 'there', 'when', 'where', 'why', 'how', 'all', 'any', 'both', 'each', 'few', 'more',
+    'most', 'other', 'some', 'such', 'no', 'nor', 'not', 'only', 'own', 'same', 'so', 'than',
+    'too', 'very', 's', 't', 'can', 'will', 'just', 'don', "don't", 'should', "should've", 'now',
+    'd', 'll', 'm', 'o', 're', 've', 'y', 'ain', 'aren', "aren't", 'couldn', "couldn't", 'didn',
+    "didn't", 'doesn', "doesn't", 'hadn', "hadn't", 'hasn', "hasn't", 'haven', "haven't", 'isn',
+    "isn't", 'ma', 'mightn', "mightn't", 'mustn', "mustn't", 'needn', "needn't", 'shan', "shan't",
+    'shouldn', "shouldn't", 'wasn', "wasn't", 'weren', "weren't", 'won', "won't", 'wouldn',
+    "wouldn't"
+))
+
+# Shared HTTP/2 clients so repeat hosts reuse pooled keep-alive connections
+MAX_RESPONSE_BYTES = 1024 * 1024  # Cap page size; 1MB of HTML is plenty to score and bounds parse time
+FETCH_TIMEOUT = httpx.Timeout(15.0, connect=3.05)
+FETCH_HEADERS = {'Accept-Encoding': 'gzip, br'}  # br is decoded by the Brotli package
+FETCH_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+
+HTTP_CLIENT = httpx.Client(
+    transport=httpx.HTTPTransport(http2=True, retries=2, limits=FETCH_LIMITS),
+    timeout=FETCH_TIMEOUT,
+    headers=FETCH_HEADERS,
+    follow_redirects=True
+)
+
+# The async client is bound to the process-wide event loop, so it is only created once batch analysis needs it
+_async_client = None
+_async_client_lock = threading.Lock()
+
+def _shared_async_client() -> httpx.AsyncClient:
+    """Async counterpart of HTTP_CLIENT, created once per process"""
+    global _async_client
+    with _async_client_lock:
+        if _async_client is None:
+            _async_client = httpx.AsyncClient(
+                transport=httpx.AsyncHTTPTransport(http2=True, retries=2, limits=FETCH_LIMITS),
+                timeout=FETCH_TIMEOUT,
+                headers=FETCH_HEADERS,
+                follow_redirects=True
+            )
+    return _async_client
+
+@atexit.register
+def _close_http_clients():
+    HTTP_CLIENT.close()
+    if _async_client is not None:
+        try:
+            run_async(_async_client.aclose(), timeout=5)
+        except Exception:
+            pass  # Exiting anyway; the OS closes the sockets
+
+# Compiled once at import instead of on every scoring call
+_VIDEO_HOST_RE = re.compile(r'youtube\.com|vimeo\.com')
+_CONTACT_RE = re.compile(r'contact|about|team', re.I)
+_SOCIAL_SHARE_RE = re.compile(r'facebook\.com/sharer|twitter\.com/share|linkedin\.com/share', re.I)
+_VIEWPORT_RE = re.compile(r'width=device-width', re.I)
+_META_CHARSET_RE = re.compile(rb'<meta[^>]+charset\s*=\s*["\']?([\w.:-]+)', re.I)
+_HOST_RE = re.compile(r'https?://([^/?#]*)')  # netloc of an absolute http(s) link; anchored, so relative hrefs fail fast
+
+# Every element any scorer looks at, matched in a single tree walk and bucketed by tag
+_NODE_SELECTOR = ', '.join((
+    'img', 'video', 'iframe[src]', 'a', 'button', 'h1', 'h2', 'h3', 'meta',
+    'script[type="application/ld+json"]', 'link[rel~="canonical"]', 'time', 'form'
+))
+_TAG_BUCKETS = {
+    'img': 'images', 'video': 'videos', 'button': 'cta_candidates', 'h1': 'headings', 'h2': 'headings',
+    'h3': 'headings', 'meta': 'metas', 'script': 'schema_scripts', 'link': 'canonical_links',
+    'time': 'times', 'form': 'forms'
+}
+
+CTA_KEYWORDS = ('buy', 'shop', 'learn more', 'sign up', 'contact', 'get started')
+
+def _build_automaton(keywords):
+    """Aho-Corasick automaton matching any of `keywords` in a single scan of the text"""
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+_CTA_AUTOMATON = _build_automaton(CTA_KEYWORDS)
+
+def _count_matching(automaton, texts):
+    """How many of `texts` contain one of the automaton's keywords, from a single scan over all of them"""
+    # Newline-joined so no keyword (none contain a newline) can match across two texts
+    starts = []
+    offset = 0
+    for text in texts:
+        starts.append(offset)
+        offset += len(text) + 1
+    joined = '\n'.join(texts)
+    return len({bisect.bisect_right(starts, end) - 1 for end, _ in automaton.iter(joined)})
+
+# Regex tokenizers: far cheaper than NLTK's Punkt and enough for counting
+_WORD_RE = re.compile(r'\w+')
+_VOWEL_GROUP_RE = re.compile(r'[aeiouy]+')
+_SENT_RE = re.compile(r'[^.!?\s][^.!?]*(?:[.!?]+|$)')  # Starts on a non-space, so long whitespace runs stay linear
+
+def word_tokenize(text):
+    """Word tokens (runs of letters/digits), punctuation dropped"""
+    return _WORD_RE.findall(text)
+
+def sent_tokenize(text):
+    """Sentences ending in . ! or ?, plus any unterminated trailing sentence"""
+    return _SENT_RE.findall(text)
+
+@functools.lru_cache(maxsize=20000)
+def _count_syllables(word):
+    """Syllable estimate (one per vowel group); memoized since word frequencies are heavily skewed"""
+    word = word.lower()
+    count = len(_VOWEL_GROUP_RE.findall(word))
+    if word.endswith("e"): # remove silent 'e'
+        count -= 1
+    if word.endswith("le") and len(word) > 2 and word[-3] not in "aeiouy": # -le ending
+        count += 1
+    if count == 0:
+        count += 1
+    return count
+
+def _read_capped_bytes(response, limit=MAX_RESPONSE_BYTES):
+    """Read a streamed (already decompressed) response body, stopping after `limit` bytes"""
+    body = bytearray()
+    for chunk in response.iter_bytes(chunk_size=64 * 1024):
+        body += chunk[:limit - len(body)]
+        if len(body) >= limit:
+            break  # Leaving the stream context closes the connection without reading the rest
+    return bytes(body)
+
+async def _aread_capped_bytes(response, limit=MAX_RESPONSE_BYTES):
+    """Async variant of _read_capped_bytes"""
+    body = bytearray()
+    async for chunk in response.aiter_bytes(chunk_size=64 * 1024):
+        body += chunk[:limit - len(body)]
+        if len(body) >= limit:
+            break  # Leaving the stream context closes the connection without reading the rest
+    return bytes(body)
+
+def _decode_html(body, encoding):
+    """Decode a page with its header charset, else its <meta charset>, else UTF-8; bad bytes are replaced"""
+    if not encoding:
+        match = _META_CHARSET_RE.search(body, 0, 1024)  # Browsers only prescan the first 1024 bytes
+        encoding = match.group(1).decode('ascii') if match else 'utf-8'
+    try:
+        return body.decode(encoding, errors='replace')
+    except LookupError:  # Unknown charset name
+        return body.decode('utf-8', errors='replace')
+
+def _fetch(url):
+    """(body bytes, declared charset or None, response headers) for a URL"""
+    with HTTP_CLIENT.stream('GET', url) as response:
+        response.raise_for_status()
+        return _read_capped_bytes(response), response.charset_encoding, response.headers
+
+async def _fetch_async(url):
+    """Async variant of _fetch, on the shared async client"""
+    async with _shared_async_client().stream('GET', url) as response:
+        response.raise_for_status()
+        return await _aread_capped_bytes(response), response.charset_encoding, response.headers
+
+# Parsing and scoring are CPU-bound Python, so batches are scored in worker processes (1 scores inline).
+# Every web worker gets its own pool, so by default the cores are split between them rather than multiplied.
+_CPUS = os.cpu_count() or 1
+_WEB_WORKERS = max(1, int(os.environ.get('WEB_CONCURRENCY', _CPUS)))
+SCORE_WORKERS = int(os.environ.get('URL_SCORE_WORKERS', max(1, _CPUS // _WEB_WORKERS)))
+_score_pool = None
+_score_pool_lock = threading.Lock()
+
+def _shared_score_pool() -> ProcessPoolExecutor:
+    """Process pool for scoring fetched pages, started once per process and reused across batches"""
+    global _score_pool
+    with _score_pool_lock:
+        if _score_pool is None:
+            _score_pool = ProcessPoolExecutor(
+                max_workers=SCORE_WORKERS,
+                mp_context=multiprocessing.get_context('spawn')
+            )
+    return _score_pool
+
+def _discard_score_pool(pool: ProcessPoolExecutor):
+    """Drop a broken pool (e.g. a worker was OOM-killed) so the next batch starts a fresh one"""
+    global _score_pool
+    with _score_pool_lock:
+        if _score_pool is pool:
+            _score_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+async def _fetch_all(urls):
+    """Fetch every URL concurrently; failures are returned in place of their page"""
+    return await asyncio.gather(*(_fetch_async(url) for url in urls), return_exceptions=True)
 
 class URLAnalyzer:
     def __init__(self):
-        self.stop_words = set(stopwords.words('english'))
+        self.stop_words = STOP_WORDS
 
-    def _get_readability_scores(self, text):
-        words = word_tokenize(text.lower())
+    def _get_readability_scores(self, text, words=None):
+        if words is None:
+            words = word_tokenize(text.lower())
         sentences = sent_tokenize(text)
         num_words = len(words)
         num_sentences = len(sentences)
-        num_syllables = sum([self._count_syllables(word) for word in words])
+        num_syllables = sum(_count_syllables(word) for word in words)
 
         if num_sentences == 0 or num_words == 0:
             return {
@@ -58,42 +256,33 @@ class URLAnalyzer:
             "flesch_kincaid_grade": flesch_kincaid_grade,
         }
 
-    def _count_syllables(self, word):
-        # A simple syllable counter (can be improved with a proper library)
-        word = word.lower()
-        count = 0
-        vowels = "aeiouy"
-        if word[0] in vowels:
-            count += 1
-        for index in range(1, len(word)):
-            if word[index] in vowels and word[index - 1] not in vowels:
-                count += 1
-        if word.endswith("e"): # remove silent 'e'
-            count -= 1
-        if word.endswith("le") and len(word) > 2 and word[-3] not in vowels: # -le ending
-            count += 1
-        if count == 0:
-            count += 1
-        return count
-
-    def _calculate_keyword_density(self, text, keywords):
-        if not text or not keywords:
-            return 0
-        
-        words = word_tokenize(text.lower())
-        total_words = len(words)
-        if total_words == 0:
-            return 0
-
-        keyword_counts = Counter(word for word in words if word in keywords)
-        density = sum(keyword_counts.values()) / total_words * 100
-        return round(density, 2)
+    def _collect_nodes(self, tree):
+        """Bucket every node the scorers need from one native selector pass, so no category re-walks the tree"""
+        nodes = {key: [] for key in (
+            'images', 'videos', 'hrefs', 'headings', 'metas', 'schema_scripts',
+            'canonical_links', 'times', 'forms', 'cta_candidates'
+        )}
+        embeds = []
+        for node in tree.css(_NODE_SELECTOR):
+            tag = node.tag
+            if tag == 'a':
+                nodes['cta_candidates'].append(node)
+                attributes = node.attributes
+                if 'href' in attributes:
+                    nodes['hrefs'].append(attributes['href'] or '')
+            elif tag == 'iframe':
+                if _VIDEO_HOST_RE.search(node.attributes['src'] or ''):
+                    embeds.append(node)
+            else:
+                nodes[_TAG_BUCKETS[tag]].append(node)
+        nodes['videos'] += embeds
+        return nodes
 
-    def _score_content_quality(self, soup, text_content):
+    def _score_content_quality(self, text_content, text_words, images, videos):
         score = 0
         findings = []
 
-        readability = self._get_readability_scores(text_content)
+        readability = self._get_readability_scores(text_content, text_words)
         word_count = readability["word_count"]
         flesch_kincaid = readability["flesch_kincaid_grade"]
 
@@ -120,8 +309,6 @@ class URLAnalyzer:
             findings.append(f"Readability may be challenging (Flesch-Kincaid: {flesch_kincaid}).")
 
         # Use of multimedia
-        images = soup.find_all('img')
-        videos = soup.find_all('video') + soup.find_all('iframe', src=re.compile(r'(youtube.com|vimeo.com)'))
         if images or videos:
             score += 15
             findings.append(f"Multimedia detected (images: {len(images)}, videos: {len(videos)}).")
@@ -135,35 +322,37 @@ class URLAnalyzer:
         final_score = max(0, min(100, score + 50)) # Normalize to 0-100, starting with a base of 50
         return {"score": final_score, "findings": findings}
 
-    def _score_relevance_and_intent(self, soup, title, meta_description, text_content, keywords=None):
+    def _score_relevance_and_intent(self, headings, title, meta_description, text_tokens, keywords=None):
         score = 0
         findings = []
         
-        if not keywords:
+        # Token sets, so each check below is a set intersection rather than a substring scan per keyword
+        title_tokens = frozenset(word_tokenize(title.lower()))
+        meta_desc_tokens = frozenset(word_tokenize(meta_description.lower()))
+
+        if keywords:
+            keywords = frozenset(kw.lower() for kw in keywords)
+        else:
             # Simple keyword extraction from title and meta description
-            all_words = word_tokenize((title + " " + meta_description).lower())
-            keywords = [word for word in all_words if word.isalnum() and word not in self.stop_words]
-            keywords = list(set(keywords)) # Unique keywords
+            keywords = frozenset(word for word in title_tokens | meta_desc_tokens if word.isalnum()) - self.stop_words
 
         # Keyword prominence in title
-        title_lower = title.lower()
-        if any(kw in title_lower for kw in keywords):
+        if keywords & title_tokens:
             score += 20
             findings.append("Keywords found in page title.")
         else:
             findings.append("No prominent keywords found in page title.")
 
         # Keyword prominence in headings (H1, H2, H3)
-        headings_text = " ".join([h.get_text() for h in soup.find_all(['h1', 'h2', 'h3'])]).lower()
-        if any(kw in headings_text for kw in keywords):
+        headings_tokens = frozenset(word_tokenize(" ".join([h.text() for h in headings]).lower()))
+        if keywords & headings_tokens:
             score += 20
             findings.append("Keywords found in headings (H1-H3).")
         else:
             findings.append("No prominent keywords found in headings.")
 
         # Content alignment with meta description
-        meta_desc_lower = meta_description.lower()
-        if any(kw in meta_desc_lower for kw in keywords) and any(kw in text_content.lower() for kw in keywords):
+        if keywords & meta_desc_tokens and keywords & text_tokens:
             score += 15
             findings.append("Content aligns with meta description and keywords.")
         else:
@@ -175,7 +364,7 @@ class URLAnalyzer:
         final_score = max(0, min(100, score + 45)) # Normalize to 0-100, starting with a base of 45
         return {"score": final_score, "findings": findings}
 
-    def _score_source_credibility(self, soup, url):
+    def _score_source_credibility(self, hrefs, url):
         score = 0
         findings = []
 
@@ -191,8 +380,7 @@ class URLAnalyzer:
             findings.append("No SSL/TLS certificate detected (HTTP). This negatively impacts credibility.")
 
         # Contact information availability (looking for common links)
-        contact_links = soup.find_all('a', href=re.compile(r'(contact|about|team)', re.I))
-        if contact_links:
+        if any(_CONTACT_RE.search(href) for href in hrefs):
             score += 15
             findings.append("Contact/About/Team links found.")
         else:
@@ -200,13 +388,17 @@ class URLAnalyzer:
             findings.append("No obvious Contact/About/Team links found.")
 
         # External link quality and quantity (simple count for now)
-        external_links = [a['href'] for a in soup.find_all('a', href=True) if urlparse(a['href']).netloc != domain and a['href'].startswith(('http', 'https'))]
-        if len(external_links) > 5:
+        # Counted without building a list; the cheap prefix check skips the regex for relative links
+        external_link_count = sum(
+            1 for href in hrefs
+            if href[:4] == 'http' and (match := _HOST_RE.match(href)) and match.group(1) != domain
+        )
+        if external_link_count > 5:
             score += 10
-            findings.append(f"Numerous external links ({len(external_links)}) detected. Quality check pending.")
-        elif len(external_links) > 0:
+            findings.append(f"Numerous external links ({external_link_count}) detected. Quality check pending.")
+        elif external_link_count > 0:
             score += 5
-            findings.append(f"Some external links ({len(external_links)}) detected. Quality check pending.")
+            findings.append(f"Some external links ({external_link_count}) detected. Quality check pending.")
         else:
             findings.append("Few or no external links detected.")
 
@@ -216,14 +408,21 @@ class URLAnalyzer:
         final_score = max(0, min(100, score + 55)) # Normalize to 0-100, starting with a base of 55
         return {"score": final_score, "findings": findings}
 
-    def _score_content_structure(self, soup):
+    def _has_viewport_meta(self, metas):
+        """Whether a mobile viewport meta tag (width=device-width) is present"""
+        return any(
+            meta.attributes.get('name') == 'viewport' and _VIEWPORT_RE.search(meta.attributes.get('content') or '')
+            for meta in metas
+        )
+
+    def _score_content_structure(self, headings, schema_scripts, metas):
         score = 0
         findings = []
 
         # Proper heading hierarchy (H1 -> H2 -> H3)
-        h1_tags = soup.find_all('h1')
-        h2_tags = soup.find_all('h2')
-        h3_tags = soup.find_all('h3')
+        h1_tags = [h for h in headings if h.tag == 'h1']
+        h2_tags = [h for h in headings if h.tag == 'h2']
+        h3_tags = [h for h in headings if h.tag == 'h3']
 
         if len(h1_tags) == 1:
             score += 20
@@ -243,7 +442,6 @@ class URLAnalyzer:
             findings.append(f"{len(h3_tags)} H3 tags found.")
 
         # Schema markup implementation (basic check for script tags with type application/ld+json)
-        schema_scripts = soup.find_all('script', type='application/ld+json')
         if schema_scripts:
             score += 20
             findings.append(f"{len(schema_scripts)} JSON-LD schema script(s) detected.")
@@ -251,8 +449,7 @@ class URLAnalyzer:
             findings.append("No JSON-LD schema markup detected.")
 
         # Mobile-friendly viewport meta tag
-        viewport_meta = soup.find('meta', attrs={'name': 'viewport', 'content': re.compile(r'width=device-width', re.I)})
-        if viewport_meta:
+        if self._has_viewport_meta(metas):
             score += 15
             findings.append("Mobile viewport meta tag detected.")
         else:
@@ -265,7 +462,7 @@ class URLAnalyzer:
         final_score = max(0, min(100, score + 30)) # Normalize to 0-100, starting with a base of 30
         return {"score": final_score, "findings": findings}
 
-    def _score_freshness_and_timeliness(self, soup, response_headers):
+    def _score_freshness_and_timeliness(self, metas, times, response_headers):
         score = 0
         findings = []
 
@@ -274,8 +471,10 @@ class URLAnalyzer:
         if last_modified:
             try:
                 # Parse date and compare with current date
-                last_modified_date = datetime.datetime.strptime(last_modified, '%a, %d %b %Y %H:%M:%S GMT')
-                age_days = (datetime.datetime.utcnow() - last_modified_date).days
+                last_modified_date = parsedate_to_datetime(last_modified)
+                if last_modified_date.tzinfo is None: # '-0000' means UTC with no source zone
+                    last_modified_date = last_modified_date.replace(tzinfo=datetime.timezone.utc)
+                age_days = (datetime.datetime.now(datetime.timezone.utc) - last_modified_date).days
                 if age_days < 90:
                     score += 25
                     findings.append(f"Content recently modified ({age_days} days ago).")
@@ -285,16 +484,15 @@ class URLAnalyzer:
                 else:
                     score -= 10
                     findings.append(f"Content last modified over a year ago ({age_days} days ago). May be outdated.")
-            except ValueError:
+            except (TypeError, ValueError):
                 findings.append(f"Could not parse Last-Modified header: {last_modified}.")
         else:
             findings.append("No Last-Modified HTTP header found.")
 
         # Publication date metadata (looking for common meta tags or schema)
-        pub_date_meta = soup.find('meta', property='article:published_time') or \
-                        soup.find('meta', {'name': 'date'}) or \
-                        soup.find('time')
-        if pub_date_meta:
+        has_pub_date = any(meta.attributes.get('property') == 'article:published_time' or
+                           meta.attributes.get('name') == 'date' for meta in metas) or bool(times)
+        if has_pub_date:
             score += 10
             findings.append("Publication date metadata detected.")
         else:
@@ -306,22 +504,20 @@ class URLAnalyzer:
         final_score = max(0, min(100, score + 40)) # Normalize to 0-100, starting with a base of 40
         return {"score": final_score, "findings": findings}
 
-    def _score_user_engagement_potential(self, soup):
+    def _score_user_engagement_potential(self, cta_candidates, forms, hrefs, videos):
         score = 0
         findings = []
 
         # Call-to-action (CTA) presence (simple check for buttons/links with common CTA text)
-        cta_elements = soup.find_all(lambda tag: tag.name in ['a', 'button'] and 
-                                       any(keyword in tag.get_text().lower() for keyword in ['buy', 'shop', 'learn more', 'sign up', 'contact', 'get started']))
-        if cta_elements:
+        cta_count = _count_matching(_CTA_AUTOMATON, [node.text().lower() for node in cta_candidates])
+        if cta_count:
             score += 20
-            findings.append(f"Call-to-action elements detected ({len(cta_elements)}).")
+            findings.append(f"Call-to-action elements detected ({cta_count}).")
         else:
             score -= 10
             findings.append("Few or no clear call-to-action elements found.")
 
         # Form availability (contact, newsletter, etc.)
-        forms = soup.find_all('form')
         if forms:
             score += 15
             findings.append(f"{len(forms)} form(s) detected (e.g., contact, newsletter).")
@@ -329,15 +525,13 @@ class URLAnalyzer:
             findings.append("No forms detected on the page.")
 
         # Social sharing buttons (common social media links)
-        social_share_links = soup.find_all('a', href=re.compile(r'(facebook.com/sharer|twitter.com/share|linkedin.com/share)', re.I))
-        if social_share_links:
+        if any(_SOCIAL_SHARE_RE.search(href) for href in hrefs):
             score += 10
             findings.append("Social sharing buttons detected.")
         else:
             findings.append("No obvious social sharing buttons found.")
 
         # Video/media embedded content (already checked in content quality, reuse if possible or re-check)
-        videos = soup.find_all('video') + soup.find_all('iframe', src=re.compile(r'(youtube.com|vimeo.com)'))
         if videos:
             score += 10
             findings.append(f"Embedded video content detected ({len(videos)}).")
@@ -350,13 +544,12 @@ class URLAnalyzer:
         final_score = max(0, min(100, score + 45)) # Normalize to 0-100, starting with a base of 45
         return {"score": final_score, "findings": findings}
 
-    def _score_technical_seo(self, soup, url, response_headers):
+    def _score_technical_seo(self, images, canonical_links, metas, url, response_headers):
         score = 0
         findings = []
 
         # Mobile responsiveness (viewport meta tag already checked in content structure, re-check or assume)
-        viewport_meta = soup.find('meta', attrs={'name': 'viewport', 'content': re.compile(r'width=device-width', re.I)})
-        if viewport_meta:
+        if self._has_viewport_meta(metas):
             score += 15
             findings.append("Mobile viewport meta tag present (indicates mobile responsiveness).")
         else:
@@ -364,16 +557,16 @@ class URLAnalyzer:
             findings.append("Mobile viewport meta tag missing. Page may not be mobile-friendly.")
 
         # Canonical tag presence
-        canonical_link = soup.find('link', rel='canonical')
-        if canonical_link and canonical_link.get('href'):
+        canonical_link = canonical_links[0] if canonical_links else None
+        if canonical_link and canonical_link.attributes.get('href'):
             score += 15
-            findings.append(f"Canonical tag found: {canonical_link['href']}.")
+            findings.append(f"Canonical tag found: {canonical_link.attributes['href']}.")
         else:
             findings.append("No canonical tag found. May lead to duplicate content issues.")
 
         # Image optimization (alt text, lazy loading - basic check)
-        images_with_alt = [img for img in soup.find_all('img') if img.get('alt')]
-        total_images = len(soup.find_all('img'))
+        images_with_alt = [img for img in images if img.attributes.get('alt')]
+        total_images = len(images)
         if total_images > 0:
             alt_text_ratio = len(images_with_alt) / total_images
             if alt_text_ratio > 0.75:
@@ -393,60 +586,116 @@ class URLAnalyzer:
         final_score = max(0, min(100, score + 40)) # Normalize to 0-100, starting with a base of 40
         return {"score": final_score, "findings": findings}
 
-    def analyze_url(self, url):
-        try:
-            response = requests.get(url, timeout=15)
-            response.raise_for_status()
-            html_content = response.text
-            soup = BeautifulSoup(html_content, 'html.parser')
-            
-            # Extract title and meta description
-            title = soup.title.string if soup.title else 'No title found'
-            meta_description_tag = soup.find('meta', attrs={'name': 'description'}) or soup.find('meta', property='og:description')
-            meta_description = meta_description_tag['content'] if meta_description_tag else 'No meta description found'
-
-            # Extract main text content (remove scripts, styles, and common navigation/footer elements)
-            for script in soup(['script', 'style', 'header', 'footer', 'nav']):
-                script.extract()
-            text_content = soup.get_text(separator=' ', strip=True)
-
-            # Perform analysis for each category
-            content_quality_result = self._score_content_quality(soup, text_content)
-            relevance_and_intent_result = self._score_relevance_and_intent(soup, title, meta_description, text_content)
-            source_credibility_result = self._score_source_credibility(soup, url)
-            content_structure_result = self._score_content_structure(soup)
-            freshness_and_timeliness_result = self._score_freshness_and_timeliness(soup, response.headers)
-            user_engagement_potential_result = self._score_user_engagement_potential(soup)
-            technical_seo_result = self._score_technical_seo(soup, url, response.headers)
-
-            # Calculate overall score (simple average for now)
-            all_scores = [
-                content_quality_result['score'],
-                relevance_and_intent_result['score'],
-                source_credibility_result['score'],
-                content_structure_result['score'],
-                freshness_and_timeliness_result['score'],
-                user_engagement_potential_result['score'],
-                technical_seo_result['score']
-            ]
-            overall_score_value = round(sum(all_scores) / len(all_scores)) if all_scores else 0
+    def _analyze_page(self, url, html_content, encoding, response_headers):
+        """Parse and score an already fetched page"""
+        # Lexbor neither sniffs <meta charset> nor tolerates invalid UTF-8, so it always gets a decoded str
+        tree = LexborHTMLParser(_decode_html(html_content, encoding))
+        
+        # Extract title and meta description
+        title_tag = tree.css_first('title')
+        title = title_tag.text() if title_tag else 'No title found'
+        meta_description_tag = tree.css_first('meta[name="description"]') or tree.css_first('meta[property="og:description"]')
+        meta_description = meta_description_tag.attributes['content'] if meta_description_tag else 'No meta description found'
+
+        # Extract visible body text (scripts, styles, and common navigation/footer elements dropped in one native pass)
+        tree.strip_tags(['script', 'style', 'header', 'footer', 'nav'])
+        text_content = (tree.body or tree.root).text(separator=' ', strip=True)
+
+        # Lowercased and tokenized once, shared by every scorer
+        text_words = word_tokenize(text_content.lower())
+
+        # Perform analysis for each category
+        nodes = self._collect_nodes(tree)
+        content_quality_result = self._score_content_quality(text_content, text_words, nodes['images'], nodes['videos'])
+        relevance_and_intent_result = self._score_relevance_and_intent(
+            nodes['headings'], title, meta_description, frozenset(text_words)
+        )
+        source_credibility_result = self._score_source_credibility(nodes['hrefs'], url)
+        content_structure_result = self._score_content_structure(nodes['headings'], nodes['schema_scripts'], nodes['metas'])
+        freshness_and_timeliness_result = self._score_freshness_and_timeliness(nodes['metas'], nodes['times'], response_headers)
+        user_engagement_potential_result = self._score_user_engagement_potential(
+            nodes['cta_candidates'], nodes['forms'], nodes['hrefs'], nodes['videos']
+        )
+        technical_seo_result = self._score_technical_seo(
+            nodes['images'], nodes['canonical_links'], nodes['metas'], url, response_headers
+        )
+
+        # Calculate overall score (simple average for now)
+        all_scores = [
+            content_quality_result['score'],
+            relevance_and_intent_result['score'],
+            source_credibility_result['score'],
+            content_structure_result['score'],
+            freshness_and_timeliness_result['score'],
+            user_engagement_potential_result['score'],
+            technical_seo_result['score']
+        ]
+        overall_score_value = round(sum(all_scores) / len(all_scores)) if all_scores else 0
 
-            return {
-                "url": url,
-                "overall_score": {
-                    "value": overall_score_value,
-                    "interpretation": "Aggregated score based on detailed analysis of 7 categories."
-                },
-                "content_quality": content_quality_result,
-                "relevance_and_intent": relevance_and_intent_result,
-                "source_credibility": source_credibility_result,
-                "content_structure": content_structure_result,
-                "freshness_and_timeliness": freshness_and_timeliness_result,
-                "user_engagement_potential": user_engagement_potential_result,
-                "technical_seo": technical_seo_result
-            }
+        return {
+            "url": url,
+            "overall_score": {
+                "value": overall_score_value,
+                "interpretation": "Aggregated score based on detailed analysis of 7 categories."
+            },
+            "content_quality": content_quality_result,
+            "relevance_and_intent": relevance_and_intent_result,
+            "source_credibility": source_credibility_result,
+            "content_structure": content_structure_result,
+            "freshness_and_timeliness": freshness_and_timeliness_result,
+            "user_engagement_potential": user_engagement_potential_result,
+            "technical_seo": technical_seo_result
+        }
 
-        except requests.exceptions.RequestException as e:
+    def _analyze_fetched(self, url, page):
+        """Score a page from _fetch, or turn its fetch error into an error result"""
+        try:
+            if isinstance(page, BaseException):
+                raise page
+            return self._analyze_page(url, *page)
+        except httpx.HTTPError as e:
             return {"error": f"Failed to fetch URL: {str(e)}"}
         except Exception as e:
             return {"error": f"An unexpected error occurred: {str(e)}"}
+
+    def analyze_url(self, url):
+        try:
+            page = _fetch(url)
+        except Exception as e:
+            page = e
+        return self._analyze_fetched(url, page)
+
+    def analyze_urls(self, urls):
+        """Analyze several URLs: fetch concurrently over the shared async client, then parse and score in worker processes"""
+        if not urls:
+            return []
+        pages = run_async(_fetch_all(urls))
+        results = [None] * len(urls)
+        fetched = []
+        for i, (url, page) in enumerate(zip(urls, pages)):
+            if isinstance(page, BaseException):
+                results[i] = self._analyze_fetched(url, page)
+            else:
+                fetched.append(i)
+
+        if SCORE_WORKERS > 1 and len(fetched) > 1:
+            # Workers only get raw bytes back and forth; each holds a single parsed tree at a time
+            pool = _shared_score_pool()
+            try:
+                scored = list(pool.map(_score_in_worker, [urls[i] for i in fetched], [pages[i] for i in fetched]))
+            except BrokenProcessPool:
+                _discard_score_pool(pool)
+                scored = [self._analyze_fetched(urls[i], pages[i]) for i in fetched]
+        else:
+            scored = [self._analyze_fetched(urls[i], pages[i]) for i in fetched]
+        for i, result in zip(fetched, scored):
+            results[i] = result
+        return results
+
+@functools.lru_cache(maxsize=None)
+def _worker_analyzer():
+    return URLAnalyzer()
+
+def _score_in_worker(url, page):
+    """Worker-process entry point: parse and score one fetched page"""
+    return _worker_analyzer()._analyze_fetched(url, page)